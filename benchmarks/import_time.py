@@ -0,0 +1,61 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# --- Benchmark czasu "zimnego" importu biblioteki larendon ---
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Każdy pomiar w świeżym interpreterze - mierzymy tylko import, bez czasu startu samego Pythona
+MEASURE_SNIPPET = """
+import sys, time, logging
+sys.path.insert(0, {repo_root!r})
+started_at = time.perf_counter()
+import larendon
+import_sec = time.perf_counter() - started_at
+started_at = time.perf_counter()
+larendon.generate
+generate_sec = time.perf_counter() - started_at
+side_effects = []
+if logging.getLogger().handlers: side_effects.append("root logger configured")
+if "larendon.console" in sys.modules: side_effects.append("console module imported")
+print(import_sec, generate_sec, "|".join(side_effects))
+"""
+
+def measure_cold_import(runs):
+    snippet = MEASURE_SNIPPET.format(repo_root=REPO_ROOT)
+    import_times_ms, generate_times_ms, side_effects = [], [], set()
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", snippet], check=True, capture_output=True, text=True).stdout.split(" ", 2)
+        import_times_ms.append(float(output[0]) * 1000)
+        generate_times_ms.append(float(output[1]) * 1000)
+        side_effects.update(effect for effect in output[2].strip().split("|") if effect)
+    return {
+        "runs": runs,
+        "import_larendon_ms": {"median": round(statistics.median(import_times_ms), 3), "max": round(max(import_times_ms), 3)},
+        "resolve_generate_ms": {"median": round(statistics.median(generate_times_ms), 3), "max": round(max(generate_times_ms), 3)},
+        "side_effects": sorted(side_effects),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold import time of the larendon package and enforce a budget.")
+    parser.add_argument("--runs", type=int, default=15, help="Number of fresh interpreters to measure (default: 15).")
+    parser.add_argument("--import-budget-ms", type=float, default=10.0, help="Maximum median time of 'import larendon' (default: 10 ms).")
+    parser.add_argument("--generate-budget-ms", type=float, default=50.0, help="Maximum median time to resolve larendon.generate, i.e. import the generation modules (default: 50 ms).")
+    args = parser.parse_args(argv)
+
+    result = measure_cold_import(args.runs)
+    violations = []
+    if result["import_larendon_ms"]["median"] > args.import_budget_ms:
+        violations.append(f"import larendon took {result['import_larendon_ms']['median']} ms (budget {args.import_budget_ms} ms)")
+    if result["resolve_generate_ms"]["median"] > args.generate_budget_ms:
+        violations.append(f"larendon.generate took {result['resolve_generate_ms']['median']} ms (budget {args.generate_budget_ms} ms)")
+    violations.extend(f"import has a side effect: {effect}" for effect in result["side_effects"])
+    result["violations"] = violations
+    print(json.dumps(result, indent=2))
+    return 1 if violations else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
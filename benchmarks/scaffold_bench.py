@@ -0,0 +1,157 @@
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# --- Benchmark przepustowości i opóźnień generowania projektów ---
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from larendon.backends import DISK_BACKEND, MemoryBackend
+from larendon.generator import generate
+from larendon.instrumentation import TRACER, MemorySink
+from larendon.writer import merge_io_stats, new_io_stats
+
+# Fazy pochodzą ze spanów prawdziwej ścieżki generate(); zadania grafu (skeleton, directories, files) biegną równolegle,
+# więc ich sumy są czasem pracy wątków, a nie czasem zegarowym
+PHASES = ("validate", "render", "skeleton", "directories", "files", "publish")
+DEFAULT_SIZES = (1, 100, 10000)
+BENCH_BACKENDS = ("disk", "memory")
+
+def synthetic_specs(count):
+    return [{"name": f"Bench Plugin {i}", "author": f"Bench Author {i % 50}", "artifact_id": f"bench-plugin-{i}"} for i in range(count)]
+
+def default_output_root():
+    # tmpfs (/dev/shm) usuwa z pomiaru opóźnienia fizycznego dysku
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+def span_phase(record):
+    if record["name"] in ("validate", "render", "publish"):
+        return record["name"]
+    if record["name"] == "task":
+        description = record["attributes"].get("description", "")
+        if description.startswith("Skeleton"):
+            return "skeleton"
+        return "directories" if description.startswith("Director") else "files"
+    return None
+
+def scaffold_with_latency(spec, output_root, io_stats, backend=DISK_BACKEND):
+    # Ta sama ścieżka co w bibliotece i trybie wsadowym: walidacja, graf zadań, szkielet, larendon.json, publikacja
+    started_at = time.perf_counter()
+    result = generate(spec, output_root, backend=backend)
+    latency = time.perf_counter() - started_at
+    merge_io_stats(io_stats, result["io"])
+    return latency
+
+def run_size(count, output_root, backend_name="disk"):
+    # Backend w pamięci mierzy samo renderowanie i logikę przyrostową - bez opóźnień systemu plików
+    if backend_name == "memory":
+        run_root = os.path.join(os.path.abspath(output_root), f"larendon-bench-{count}")
+        backend = MemoryBackend(run_root)
+    else:
+        run_root = tempfile.mkdtemp(prefix=f"larendon-bench-{count}-", dir=output_root)
+        backend = DISK_BACKEND
+    span_sink = TRACER.add_sink(MemorySink())
+    try:
+        specs = synthetic_specs(count)
+        io_stats = new_io_stats()
+        latencies = []
+        started_at = time.perf_counter()
+        for spec in specs:
+            latencies.append(scaffold_with_latency(spec, run_root, io_stats, backend))
+        elapsed_sec = time.perf_counter() - started_at
+    finally:
+        TRACER.remove_sink(span_sink)
+        if backend is DISK_BACKEND:
+            shutil.rmtree(run_root, ignore_errors=True)
+    phase_totals_ms = {phase: 0.0 for phase in PHASES}
+    for record in span_sink.records:
+        phase = span_phase(record)
+        if phase is not None:
+            phase_totals_ms[phase] += record["duration_ms"]
+    # Pliki szkieletu są klonowane, a nie zapisywane - oba rodzaje to pliki projektu
+    files_count = io_stats["files_written"] + io_stats["files_cloned"]
+
+    latencies.sort()
+    return {
+        "projects": count,
+        "backend": backend_name,
+        "elapsed_sec": round(elapsed_sec, 6),
+        "projects_per_second": round(count / elapsed_sec, 3) if elapsed_sec > 0 else None,
+        "files_per_second": round(files_count / elapsed_sec, 3) if elapsed_sec > 0 else None,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50) * 1000, 4),
+            "p99": round(percentile(latencies, 0.99) * 1000, 4),
+            "max": round(latencies[-1] * 1000, 4) if latencies else 0.0,
+        },
+        "phases_ms": {phase: round(total_ms, 3) for phase, total_ms in phase_totals_ms.items()},
+        "io": io_stats,
+    }
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare_with_baseline(result, baseline, max_regression):
+    regressions = []
+    baseline_runs = {run["projects"]: run for run in baseline.get("runs", [])}
+    for run in result["runs"]:
+        baseline_run = baseline_runs.get(run["projects"])
+        if not baseline_run or not baseline_run.get("files_per_second") or not run.get("files_per_second"):
+            continue
+        change = run["files_per_second"] / baseline_run["files_per_second"] - 1.0
+        if change < -max_regression:
+            regressions.append(f"{run['projects']} project(s): {run['files_per_second']} files/s vs baseline {baseline_run['files_per_second']} files/s ({change:+.1%})")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Larendon scaffolding throughput and latency on synthetic plugin specs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Numbers of projects to generate (default: 1 100 10000).")
+    parser.add_argument("--output-dir", default=default_output_root(), help="Where projects are generated; defaults to /dev/shm (tmpfs) when available.")
+    parser.add_argument("--backend", choices=BENCH_BACKENDS, default="disk", help="Where projects are generated: real files under --output-dir, or an in-memory backend (default: disk).")
+    parser.add_argument("--json", dest="json_path", help="Also write the JSON result to this file.")
+    parser.add_argument("--baseline", help="JSON result of an earlier run to compare throughput against.")
+    parser.add_argument("--max-regression", type=float, default=0.15, help="Allowed drop of files/s against the baseline before failing (default: 0.15 = 15%%).")
+    args = parser.parse_args(argv)
+
+    result = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "output_dir": os.path.abspath(args.output_dir),
+        "backend": args.backend,
+        "runs": [run_size(count, args.output_dir, args.backend) for count in args.sizes],
+    }
+    # ru_maxrss jest w KiB na Linuksie (w bajtach na macOS)
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result["peak_rss_kib"] = peak_rss // 1024 if sys.platform == "darwin" else peak_rss
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            result["regressions"] = compare_with_baseline(result, json.load(f), args.max_regression)
+        exit_code = 1 if result["regressions"] else 0
+
+    serialized = json.dumps(result, indent=2)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            f.write(serialized + "\n")
+    print(serialized)
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
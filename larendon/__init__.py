@@ -0,0 +1,38 @@
+# Publiczne API jest ładowane leniwie (PEP 562): samo "import larendon" nie importuje modułów roboczych,
+# nie konfiguruje logowania i nie wykonuje żadnych operacji na dysku.
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    "generate": "larendon.generator",
+    "generate_starter_files_and_folders": "larendon.generator",
+    "generate_project": "larendon.pipeline",
+    "generate_projects": "larendon.pipeline",
+    "run_batch_scaffolding": "larendon.batch",
+    "write_projects_archive": "larendon.archive",
+    "load_plugin_specs_manifest": "larendon.specs",
+    "normalize_manifest_row": "larendon.specs",
+    "validate_plugin_specs": "larendon.validation",
+    "SpecValidationError": "larendon.validation",
+    "TemplateRegistry": "larendon.templating",
+    "TemplateError": "larendon.templating",
+    "TEMPLATE_REGISTRY": "larendon.templating",
+    "register_template_directories": "larendon.templating",
+    "ProjectWriter": "larendon.writer",
+    "OutputBackend": "larendon.backends",
+    "DiskBackend": "larendon.backends",
+    "MemoryBackend": "larendon.backends",
+    "ArchiveBackend": "larendon.archive",
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'larendon' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,160 @@
+import logging
+import sys
+import time
+
+from larendon.backends import PathKeyedBackend
+from larendon.generator import scaffold_project_from_spec
+from larendon.specs import apply_spec_defaults, load_plugin_specs_manifest, normalize_manifest_row
+from larendon.templating import register_template_directories
+from larendon.validation import validate_plugin_specs
+
+logger = logging.getLogger(__name__)
+
+# --- Strumieniowe archiwum: projekty trafiają prosto do zip/tar, bez katalogów pośrednich na dysku ---
+ARCHIVE_FORMATS = ("zip", "tar", "tar.gz")
+ARCHIVE_FILE_MODE = 0o644
+ARCHIVE_DIRECTORY_MODE = 0o755
+
+class ArchiveWriter:
+    """Pisze wpisy po kolei do dowolnego obiektu plikowego - także nieprzewijalnego (potok, stdout, odpowiedź HTTP).
+
+    zip bez możliwości seek() zapisuje rozmiary w deskryptorach danych za treścią, tar działa w trybie strumieniowym ("w|").
+    """
+
+    def __init__(self, fileobj, archive_format="zip", mtime=None):
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unknown archive format '{archive_format}'. Use one of: {', '.join(ARCHIVE_FORMATS)}.")
+        self.archive_format = archive_format
+        self.mtime = time.time() if mtime is None else mtime
+        self.stats = {"files": 0, "directories": 0, "bytes": 0}
+        if archive_format == "zip":
+            import zipfile
+            self.zip_file = zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED)
+            self.tar_file = None
+        else:
+            import tarfile
+            self.tar_file = tarfile.open(fileobj=fileobj, mode="w|gz" if archive_format == "tar.gz" else "w|", format=tarfile.PAX_FORMAT)
+            self.zip_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def add_directory(self, archive_path):
+        archive_path = archive_path.rstrip("/") + "/"
+        if self.zip_file is not None:
+            import zipfile
+            zip_info = zipfile.ZipInfo(archive_path, date_time=time.localtime(self.mtime)[:6])
+            zip_info.external_attr = (0o40000 | ARCHIVE_DIRECTORY_MODE) << 16 | 0x10
+            self.zip_file.writestr(zip_info, b"")
+        else:
+            import tarfile
+            tar_info = tarfile.TarInfo(archive_path.rstrip("/"))
+            tar_info.type = tarfile.DIRTYPE
+            tar_info.mode = ARCHIVE_DIRECTORY_MODE
+            tar_info.mtime = self.mtime
+            self.tar_file.addfile(tar_info)
+        self.stats["directories"] += 1
+
+    def add_file(self, archive_path, data):
+        if self.zip_file is not None:
+            import zipfile
+            zip_info = zipfile.ZipInfo(archive_path, date_time=time.localtime(self.mtime)[:6])
+            zip_info.external_attr = (0o100000 | ARCHIVE_FILE_MODE) << 16
+            zip_info.compress_type = zipfile.ZIP_DEFLATED
+            self.zip_file.writestr(zip_info, data)
+        else:
+            import io
+            import tarfile
+            tar_info = tarfile.TarInfo(archive_path)
+            tar_info.size = len(data)
+            tar_info.mode = ARCHIVE_FILE_MODE
+            tar_info.mtime = self.mtime
+            self.tar_file.addfile(tar_info, io.BytesIO(data))
+        self.stats["files"] += 1
+        self.stats["bytes"] += len(data)
+
+    def close(self):
+        if self.zip_file is not None:
+            self.zip_file.close()
+            self.zip_file = None
+        if self.tar_file is not None:
+            self.tar_file.close()
+            self.tar_file = None
+
+# --- Backend archiwum: potok generowania publikuje każdy projekt jako kolejne wpisy strumienia ---
+class ArchiveBackend(PathKeyedBackend):
+    """Archiwum jest tylko do zapisu: żaden projekt w nim "nie istnieje", więc każdy jest generowany od zera (wraz z manifestem)."""
+
+    name = "archive"
+
+    def __init__(self, archive_writer, root="."):
+        super().__init__(root)
+        self.archive_writer = archive_writer
+        self.written_directories = set()
+
+    def read_bytes(self, path):
+        raise FileNotFoundError(f"The archive backend is write-only: '{path}'")
+
+    def list_dir(self, path):
+        raise FileNotFoundError(f"The archive backend is write-only: '{path}'")
+
+    def publish(self, base_path, staged_directories, staged_files):
+        directory_keys, file_entries = self.publish_keys(base_path, staged_directories, staged_files)
+        # Cały projekt trafia do strumienia pod jedną blokadą - wpisy różnych projektów nigdy się nie przeplatają
+        with self.lock:
+            for directory_key in directory_keys:
+                if directory_key in self.written_directories: continue
+                self.archive_writer.add_directory(directory_key)
+                self.written_directories.add(directory_key)
+            for file_key, data in file_entries:
+                self.archive_writer.add_file(file_key, data)
+
+def write_projects_archive(specs, fileobj, archive_format="zip", default_variant=None):
+    """Zapisuje kolejne projekty do archiwum; w pamięci jest naraz tylko jeden projekt, więc zużycie pamięci nie rośnie z liczbą projektów."""
+    started_at = time.perf_counter()
+    failures = []
+    succeeded = 0
+    with ArchiveWriter(fileobj, archive_format) as archive_writer:
+        archive_backend = ArchiveBackend(archive_writer)
+        for index, row in enumerate(specs):
+            folder = row.get("folder", "") if isinstance(row, dict) else ""
+            try:
+                if not isinstance(row, dict):
+                    raise ValueError("Plugin spec must be a mapping.")
+                spec = normalize_manifest_row(row)
+                folder = spec["folder"]
+                scaffold_project_from_spec(spec, ".", default_variant, task_workers=1, backend=archive_backend)
+                succeeded += 1
+            except (ValueError, KeyError) as e:
+                logger.error(f"Archive row {index} ('{folder}') failed: {e}")
+                failures.append({"index": index, "folder": folder, "error": str(e)})
+    elapsed_sec = time.perf_counter() - started_at
+    return {
+        "format": archive_format,
+        "total": succeeded + len(failures),
+        "succeeded": succeeded,
+        "failed": len(failures),
+        "elapsed_sec": round(elapsed_sec, 6),
+        "entries": archive_writer.stats,
+        "failures": failures,
+    }
+
+def run_archive_batch(manifest_path, archive_path="-", archive_format="zip", template_directories=None, default_variant=None, spec_defaults=None):
+    register_template_directories(template_directories)
+    rows = apply_spec_defaults(load_plugin_specs_manifest(manifest_path), spec_defaults)
+    # Przed otwarciem archiwum - przy błędnym manifeście na stdout nie trafia nawet nagłówek strumienia
+    rows = validate_plugin_specs(rows)
+    logger.info(f"--- Archive run started: manifest '{manifest_path}', {archive_format} to '{archive_path}' ---")
+    if archive_path == "-":
+        summary = write_projects_archive(rows, sys.stdout.buffer, archive_format, default_variant)
+        sys.stdout.buffer.flush()
+    else:
+        with open(archive_path, "wb") as archive_file:
+            summary = write_projects_archive(rows, archive_file, archive_format, default_variant)
+    summary["archive"] = archive_path
+    logger.info(f"--- Archive run finished: {summary['succeeded']}/{summary['total']} project(s) in {summary['elapsed_sec']:.3f}s ---")
+    return summary
@@ -0,0 +1,194 @@
+import abc
+import logging
+import os
+import threading
+
+from larendon.writer import ProjectWriter, encode_generated_content, new_io_stats
+
+logger = logging.getLogger(__name__)
+
+# --- Backendy wyjścia: gdzie trafiają wygenerowane projekty (dysk, pamięć, archiwum) ---
+class OutputBackend(abc.ABC):
+    """Interfejs backendu: odczyt opublikowanego stanu (manifest, pliki do porównania) i writer publikujący projekt.
+
+    Ścieżki są takie jak w całym potoku (folder projektu pod output_root); read_bytes i list_dir zgłaszają
+    FileNotFoundError dla brakujących elementów, tak jak odpowiedniki z modułu os. Backend bez którejś z metod
+    abstrakcyjnych nie da się utworzyć - błąd pojawia się od razu, a nie w połowie przebiegu.
+    """
+
+    name = None
+    # Czy writer potrafi sklonować drzewo z cache szkieletu na dysku (ProjectWriter.clone_tree)
+    supports_clone = False
+
+    @abc.abstractmethod
+    def read_bytes(self, path):
+        ...
+
+    @abc.abstractmethod
+    def list_dir(self, path):
+        ...
+
+    @abc.abstractmethod
+    def open_project_writer(self, base_path, fsync_policy="none"):
+        ...
+
+class DiskBackend(OutputBackend):
+    name = "disk"
+    supports_clone = True
+
+    def read_bytes(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def list_dir(self, path):
+        return os.listdir(path)
+
+    def open_project_writer(self, base_path, fsync_policy="none"):
+        return ProjectWriter(base_path, fsync_policy, self)
+
+DISK_BACKEND = DiskBackend()
+
+class StagedProjectWriter:
+    """Writer bez dysku: pliki projektu czekają w pamięci i są przekazywane backendowi dopiero w commit(), wszystkie naraz."""
+
+    def __init__(self, backend, base_path, fsync_policy="none"):
+        self.backend = backend
+        self.base_path = os.path.abspath(base_path)
+        self.fsync_policy = fsync_policy
+        self.stats = new_io_stats()
+        self.staged_files = {}
+        self.staged_directories = []
+        self.closed = False
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+    def _check_open(self):
+        if self.closed:
+            raise RuntimeError(f"Project writer for {self.base_path} is already closed.")
+
+    def ensure_directory(self, relative_dir):
+        with self.lock:
+            self._check_open()
+            self.staged_directories.append(relative_dir.replace(os.sep, "/"))
+
+    def stage_file(self, relative_path, content):
+        data = encode_generated_content(content)
+        with self.lock:
+            self._check_open()
+            self.staged_files[relative_path.replace(os.sep, "/")] = data
+            self.stats["files_written"] += 1
+            self.stats["bytes_written"] += len(data)
+
+    def clone_tree(self, source_root, relative_files, relative_dirs=(), use_hardlink=False, file_sizes=None):
+        raise RuntimeError(f"The {self.backend.name} backend cannot clone a skeleton tree; its files are written one by one.")
+
+    def commit(self):
+        with self.lock:
+            self._check_open()
+            staged_directories, staged_files = self.staged_directories, self.staged_files
+        try:
+            if staged_directories or staged_files:
+                self.backend.publish(self.base_path, staged_directories, staged_files)
+        finally:
+            self.abort()
+
+    def abort(self):
+        with self.lock:
+            self.closed = True
+            self.staged_files = {}
+            self.staged_directories = []
+
+class PathKeyedBackend(OutputBackend):
+    """Wspólna część backendów bez systemu plików: ścieżki zamieniane na klucze "folder/plik" względem root."""
+
+    def __init__(self, root="."):
+        self.root = os.path.abspath(root)
+        self.lock = threading.Lock()
+
+    def path_key(self, path):
+        relative_path = os.path.relpath(os.path.abspath(path), self.root)
+        if relative_path == os.curdir:
+            return ""
+        if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+            raise ValueError(f"Path '{path}' is outside of the {self.name} backend root '{self.root}'.")
+        return relative_path.replace(os.sep, "/")
+
+    def open_project_writer(self, base_path, fsync_policy="none"):
+        self.path_key(base_path)
+        return StagedProjectWriter(self, base_path, fsync_policy)
+
+    @abc.abstractmethod
+    def publish(self, base_path, staged_directories, staged_files):
+        """Przyjmuje cały projekt naraz (wywoływane przez StagedProjectWriter.commit)."""
+
+    def publish_keys(self, base_path, staged_directories, staged_files):
+        """Klucze folderów (z przodkami, od najpłytszego) i plików projektu w kolejności zapisu."""
+        base_key = self.path_key(base_path)
+        prefix = f"{base_key}/" if base_key else ""
+        directory_keys = [base_key] if base_key else []
+        for relative_dir in list(staged_directories) + [relative_path.rpartition("/")[0] for relative_path in staged_files]:
+            parts = relative_dir.split("/") if relative_dir else []
+            directory_keys.extend(prefix + "/".join(parts[:i]) for i in range(1, len(parts) + 1))
+        # Przodkowie folderu projektu (np. output_root/grupa/projekt) też muszą istnieć
+        base_parts = base_key.split("/") if base_key else []
+        directory_keys[:0] = ["/".join(base_parts[:i]) for i in range(1, len(base_parts))]
+        return list(dict.fromkeys(directory_keys)), [(prefix + relative_path, data) for relative_path, data in staged_files.items()]
+
+class MemoryBackend(PathKeyedBackend):
+    """Wirtualny system plików w słowniku: files["folder/pom.xml"] -> bajty. Nic nie dotyka dysku.
+
+    Z fallback=DISK_BACKEND działa jak nakładka: odczyty brakujących ścieżek trafiają na dysk, zapisy tylko do pamięci -
+    przebieg "na sucho" widzi istniejące projekty i raportuje created/updated/unchanged/modified jak prawdziwy.
+    """
+
+    name = "memory"
+
+    def __init__(self, root=".", fallback=None):
+        super().__init__(root)
+        self.fallback = fallback
+        self.files = {}
+        self.directories = set()
+
+    def read_bytes(self, path):
+        path_key = self.path_key(path)
+        with self.lock:
+            data = self.files.get(path_key)
+        if data is not None:
+            return data
+        if self.fallback is not None:
+            return self.fallback.read_bytes(path)
+        raise FileNotFoundError(f"No such file in the memory backend: '{path}'")
+
+    def list_dir(self, path):
+        path_key = self.path_key(path)
+        prefix = f"{path_key}/" if path_key else ""
+        with self.lock:
+            entries = {key[len(prefix):].split("/", 1)[0] for key in list(self.files) + list(self.directories) if key.startswith(prefix) and key != path_key}
+            exists = path_key in self.directories or not path_key
+        if self.fallback is not None:
+            try:
+                entries.update(self.fallback.list_dir(path))
+                exists = True
+            except FileNotFoundError:
+                pass
+        if not entries and not exists:
+            raise FileNotFoundError(f"No such folder in the memory backend: '{path}'")
+        return sorted(entries)
+
+    def publish(self, base_path, staged_directories, staged_files):
+        directory_keys, file_entries = self.publish_keys(base_path, staged_directories, staged_files)
+        with self.lock:
+            self.directories.update(directory_keys)
+            self.files.update(file_entries)
+
+    def read_text(self, path_key):
+        return self.files[path_key].decode("utf-8").replace(os.linesep, "\n")
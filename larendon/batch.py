@@ -0,0 +1,174 @@
+import logging
+import multiprocessing
+import os
+import sys
+import time
+
+from larendon.backends import DISK_BACKEND, DiskBackend
+from larendon.generator import scaffold_project_from_spec
+from larendon.incremental import new_generation_report
+from larendon.instrumentation import TRACER, JsonLinesSink, span
+from larendon.mavencache import merge_maven_cache_stats, new_maven_cache_stats
+from larendon.progress import ProgressTracker, format_eta
+from larendon.specs import apply_spec_defaults, load_plugin_specs_manifest, normalize_manifest_row
+from larendon.templating import register_template_directories
+from larendon.validation import validate_plugin_specs
+from larendon.writer import merge_io_stats, new_io_stats
+
+logger = logging.getLogger(__name__)
+
+# --- Tryb wsadowy: inicjalizacja procesów roboczych ---
+def initialize_batch_worker(template_directories, log_file_name=None, trace_path=None):
+    # Procesy robocze uruchamiane metodą "spawn" nie dziedziczą rejestru szablonów ani konfiguracji logowania
+    register_template_directories(template_directories)
+    if log_file_name and not logging.getLogger().handlers:
+        from larendon.cli import configure_logging
+        configure_logging(log_file_name)
+    # Proces potomny (także po "fork") dostaje własny uchwyt pliku śladu zamiast ujść odziedziczonych po rodzicu
+    if trace_path and multiprocessing.parent_process() is not None:
+        TRACER.sinks = [JsonLinesSink(trace_path)]
+
+# --- Tryb wsadowy: przetwarzanie pojedynczego wiersza manifestu (także w procesach roboczych) ---
+def scaffold_manifest_row(index, row, output_root, default_variant=None, force=False, fsync_policy="none", maven_cache=None, maven_cache_mode="copy", skeleton_mode="clone", backend=None):
+    folder = row.get("folder", "") if isinstance(row, dict) else ""
+    try:
+        if not isinstance(row, dict):
+            raise ValueError("Plugin spec must be a mapping.")
+        spec = normalize_manifest_row(row)
+        folder = spec["folder"]
+        io_stats = new_io_stats()
+        maven_cache_stats = new_maven_cache_stats()
+        # Projekty są już generowane równolegle przez pulę - graf zadań jednego projektu wykonujemy w bieżącym wątku
+        generation_report = scaffold_project_from_spec(spec, output_root, default_variant, force, fsync_policy, io_stats, task_workers=1, maven_cache=maven_cache, maven_cache_mode=maven_cache_mode, maven_cache_stats=maven_cache_stats, skeleton_mode=skeleton_mode, backend=backend)
+        return {"index": index, "folder": folder, "ok": True, "files": generation_report, "io": io_stats, "maven_cache": maven_cache_stats}
+    except Exception as e:
+        logger.error(f"Batch row {index} ('{folder}') failed: {e}")
+        return {"index": index, "folder": folder, "ok": False, "error": str(e)}
+
+def scaffold_manifest_chunk(indexed_rows, output_root, default_variant=None, force=False, fsync_policy="none", maven_cache=None, maven_cache_mode="copy", skeleton_mode="clone", backend=None):
+    return [scaffold_manifest_row(index, row, output_root, default_variant, force, fsync_policy, maven_cache, maven_cache_mode, skeleton_mode, backend) for index, row in indexed_rows]
+
+async def scaffold_manifest_rows_async(indexed_rows, output_root, concurrency, default_variant=None, force=False, fsync_policy="none", on_result=None, maven_cache=None, maven_cache_mode="copy", skeleton_mode="clone", backend=None):
+    import asyncio
+    from larendon.pipeline import generate_project
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def scaffold_row(index, row):
+        folder = row.get("folder", "") if isinstance(row, dict) else ""
+        async with semaphore:
+            try:
+                if not isinstance(row, dict):
+                    raise ValueError("Plugin spec must be a mapping.")
+                project_result = await generate_project(row, output_root, default_variant, force, fsync_policy, maven_cache, maven_cache_mode, skeleton_mode, backend)
+                result = {"index": index, "folder": project_result["folder"], "ok": True, "files": project_result["files"], "io": project_result["io"], "maven_cache": project_result.get("maven_cache", {})}
+            except Exception as e:
+                logger.error(f"Batch row {index} ('{folder}') failed: {e}")
+                result = {"index": index, "folder": folder, "ok": False, "error": str(e)}
+        if on_result: on_result(result)
+        return result
+
+    return await asyncio.gather(*(scaffold_row(index, row) for index, row in indexed_rows))
+
+# --- Tryb wsadowy: zbiorczy wskaźnik postępu dla wszystkich procesów roboczych ---
+def print_batch_progress(progress, final):
+    sys.stderr.write(f"\r↺ │ Batch: {progress['percent']}% ({progress['done']}/{progress['total']}, {progress['failed']} failed, {progress['rate']:.1f} projects/s, ETA {format_eta(progress['eta_sec'])})\033[K" + ("\n" if final else ""))
+    sys.stderr.flush()
+
+# --- Tryb wsadowy: przetwarzanie całego manifestu ---
+BATCH_EXECUTORS = ("process", "thread", "async")
+
+def run_batch_scaffolding(manifest_path, output_root, workers=None, executor_kind="process", show_progress=None, template_directories=None, default_variant=None, force=False, fsync_policy="none", log_file_name=None, trace_path=None, spec_defaults=None, maven_cache=None, maven_cache_mode="copy", skeleton_mode="clone", backend=None):
+    if executor_kind not in BATCH_EXECUTORS:
+        raise ValueError(f"Unknown executor '{executor_kind}'. Use one of: {', '.join(BATCH_EXECUTORS)}.")
+    workers = max(1, workers or os.cpu_count() or 1)
+    if backend is None:
+        backend = DISK_BACKEND
+    elif executor_kind == "process" and not isinstance(backend, DiskBackend):
+        # Backend w pamięci (albo strumień archiwum) żyje w tym procesie - procesy robocze nie mogłyby do niego pisać
+        executor_kind = "thread"
+    if show_progress is None:
+        show_progress = sys.stderr.isatty()
+    logger.info(f"--- Batch run started: manifest '{manifest_path}', output '{output_root}', {workers} {executor_kind} worker(s) ---")
+    register_template_directories(template_directories)
+    if maven_cache and not isinstance(backend, DiskBackend):
+        raise ValueError(f"Maven cache pre-warm needs a real project folder; it is not available with the {backend.name} backend.")
+    if maven_cache and not os.path.isdir(maven_cache):
+        raise ValueError(f"Maven cache directory '{maven_cache}' does not exist.")
+    rows = apply_spec_defaults(load_plugin_specs_manifest(manifest_path), spec_defaults)
+    # Błędny lub kolidujący wiersz odrzuca całą partię, zanim powstanie jakikolwiek folder
+    with span("validate_manifest", rows=len(rows)):
+        rows = validate_plugin_specs(rows)
+    if isinstance(backend, DiskBackend):
+        os.makedirs(output_root, exist_ok=True)
+
+    indexed_rows = list(enumerate(rows))
+    # Paczki wierszy ograniczają narzut IPC puli procesów, a jednocześnie pozwalają na płynny postęp
+    chunk_size = max(1, len(indexed_rows) // (workers * 8)) if workers > 1 else max(1, len(indexed_rows))
+    chunks = [indexed_rows[i:i + chunk_size] for i in range(0, len(indexed_rows), chunk_size)]
+
+    results = []
+    started_at = time.perf_counter()
+    # Wyniki tylko zwiększają liczniki; linię postępu odświeża osobny wątek (co najwyżej PROGRESS_REFRESH_HZ razy na sekundę)
+    batch_progress = ProgressTracker(len(rows), print_batch_progress).start() if show_progress else None
+    try:
+        if executor_kind == "async":
+            def record_result(result):
+                results.append(result)
+                if batch_progress: batch_progress.advance(result["folder"], failed_count=0 if result["ok"] else 1)
+            import asyncio
+            asyncio.run(scaffold_manifest_rows_async(indexed_rows, output_root, workers, default_variant, force, fsync_policy, record_result, maven_cache, maven_cache_mode, skeleton_mode, backend))
+        elif workers == 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                for index, row in chunk:
+                    result = scaffold_manifest_row(index, row, output_root, default_variant, force, fsync_policy, maven_cache, maven_cache_mode, skeleton_mode, backend)
+                    results.append(result)
+                    if batch_progress: batch_progress.advance(result["folder"], failed_count=0 if result["ok"] else 1)
+        else:
+            import concurrent.futures
+            pool_class = concurrent.futures.ProcessPoolExecutor if executor_kind == "process" else concurrent.futures.ThreadPoolExecutor
+            with pool_class(max_workers=workers, initializer=initialize_batch_worker, initargs=(template_directories, log_file_name, trace_path)) as pool:
+                pending = [pool.submit(scaffold_manifest_chunk, chunk, output_root, default_variant, force, fsync_policy, maven_cache, maven_cache_mode, skeleton_mode, backend) for chunk in chunks]
+                for future in concurrent.futures.as_completed(pending):
+                    chunk_results = future.result()
+                    results.extend(chunk_results)
+                    if batch_progress: batch_progress.advance(chunk_results[-1]["folder"], count=len(chunk_results), failed_count=sum(1 for result in chunk_results if not result["ok"]))
+    finally:
+        if batch_progress: batch_progress.stop()
+    elapsed_sec = time.perf_counter() - started_at
+
+    results.sort(key=lambda result: result["index"])
+    failures = [{"index": r["index"], "folder": r["folder"], "error": r["error"]} for r in results if not r["ok"]]
+    succeeded = len(results) - len(failures)
+    file_counts = {status: 0 for status in new_generation_report()}
+    modified_files = []
+    io_stats = new_io_stats()
+    maven_cache_stats = new_maven_cache_stats()
+    for result in results:
+        merge_io_stats(io_stats, result.get("io", {}))
+        merge_maven_cache_stats(maven_cache_stats, result.get("maven_cache", {}))
+        for status, relative_paths in result.get("files", {}).items():
+            file_counts[status] += len(relative_paths)
+        modified_files.extend(f"{result['folder']}/{relative_path}" for relative_path in result.get("files", {}).get("modified", []))
+    summary = {
+        "manifest": os.path.abspath(manifest_path),
+        "output_root": os.path.abspath(output_root),
+        "backend": backend.name,
+        "executor": executor_kind,
+        "workers": workers,
+        "total": len(rows),
+        "succeeded": succeeded,
+        "failed": len(failures),
+        "elapsed_sec": round(elapsed_sec, 6),
+        "projects_per_second": round(succeeded / elapsed_sec, 3) if elapsed_sec > 0 else None,
+        "files": file_counts,
+        "modified_files": modified_files,
+        "fsync_policy": fsync_policy,
+        "skeleton_mode": skeleton_mode,
+        "io": io_stats,
+        "failures": failures,
+    }
+    if maven_cache:
+        summary["maven_cache"] = dict(maven_cache_stats, cache=os.path.abspath(maven_cache), mode=maven_cache_mode)
+    logger.info(f"--- Batch run finished: {succeeded}/{len(rows)} project(s) in {elapsed_sec:.3f}s ---")
+    return summary
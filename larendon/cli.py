@@ -0,0 +1,468 @@
+import argparse
+import json
+import logging
+import os
+import sys
+
+from larendon.archive import ARCHIVE_FORMATS, run_archive_batch
+from larendon.backends import DISK_BACKEND, MemoryBackend
+from larendon.batch import BATCH_EXECUTORS, run_batch_scaffolding
+from larendon.console import RENDERER_CHOICES, caution_gradient_cycle, done_gradient_cycle, get_time_str, green_gradient_cycle, red_gradient_cycle, select_renderer
+from larendon.credentials import KEY_ENV_VAR, configured_access_key, end_session, has_valid_session, is_valid_access_key, issue_session_token
+from larendon.generator import build_pom_xml_content, generate_starter_files_and_folders
+from larendon.incremental import write_generated_files
+from larendon.instrumentation import TRACER, JsonLinesSink, profiled, span
+from larendon.mavencache import MAVEN_CACHE_MODES, prewarm_project_maven_cache
+from larendon.naming import sanitize_artifact_id, sanitize_group_id
+from larendon.skeleton import SKELETON_MODES
+from larendon.specs import PROJECT_SPEC_FILE_NAME, serialize_project_spec
+from larendon.templating import register_template_directories
+from larendon.validation import SpecValidationError
+from larendon.versions import VERSION_INDEX_ENV_VAR, VersionIndexError, import_version_index_from_maven, load_version_index, resolve_version_target
+from larendon.watch import WATCH_DEBOUNCE_SEC, WATCH_POLL_INTERVAL_SEC, ProjectWatcher
+from larendon.writer import FSYNC_POLICIES, new_io_stats
+
+logger = logging.getLogger(__name__)
+
+# --- Konfiguracja Logowania (tylko dla programu uruchamianego z wiersza poleceń, nie przy imporcie biblioteki) ---
+LOG_FILE_NAME = "skrypt_log.txt"
+
+def configure_logging(log_file_name=LOG_FILE_NAME):
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        filename=log_file_name,
+        filemode='a'
+    )
+
+# --- Parser argumentów wiersza poleceń ---
+def build_argument_parser():
+    parser = argparse.ArgumentParser(prog="Larendon", description="Minecraft plugin project scaffolding tool. Run without arguments for the interactive mode.")
+    parser.add_argument("--template-dir", action="append", default=[], metavar="DIR", help="Directory with house templates (e.g. DIR/paper/pom.xml.tmpl); overrides built-in templates. May be repeated.")
+    parser.add_argument("--variant", default=None, help="Template variant (e.g. 'paper') used when a manifest row does not name one and in the interactive mode.")
+    parser.add_argument("--trace", metavar="FILE", help="Append a JSON line per timing span (task, project, publish, top-level steps) to FILE.")
+    parser.add_argument("--profile", metavar="FILE", help="Run under cProfile and write the statistics to FILE (readable with pstats).")
+    parser.add_argument("--minecraft-version", default=None, help="Target Minecraft version from the version index (default: the index default), used when a manifest row does not name one and in the interactive mode.")
+    parser.add_argument("--server", default=None, help="Target server API from the version index, e.g. 'spigot' or 'paper' (default: the index default).")
+    parser.add_argument("--version-index", metavar="FILE", help=f"Version index to use instead of ~/.larendon/versions.json or the built-in one (also settable with {VERSION_INDEX_ENV_VAR}).")
+    parser.add_argument("--maven-cache", metavar="DIR", help="Shared local Maven repository (m2 layout); after generation the artifacts pom.xml needs are copied from it into PROJECT/.m2/repository.")
+    parser.add_argument("--maven-cache-mode", choices=MAVEN_CACHE_MODES, default="copy", help="How --maven-cache artifacts are placed in the project: independent copies, or hard links when on the same filesystem (default: copy).")
+    parser.add_argument("--skeleton", choices=SKELETON_MODES, default="clone", help="How invariant files and folders (templates skeleton/) reach a new project: cloned from a cached skeleton tree (reflink/copy_file_range/copy), hard-linked to it (edits would change the cache!), or written one by one (default: clone).")
+    parser.add_argument("--renderer", choices=RENDERER_CHOICES, default="auto", help="Output style of the interactive mode; 'auto' disables animations when stdout is not a terminal.")
+    subparsers = parser.add_subparsers(dest="command")
+    batch_parser = subparsers.add_parser("batch", help="Scaffold many plugins from a JSON/TOML/CSV manifest without prompts.")
+    batch_parser.add_argument("manifest", help="Path to a .json, .toml or .csv manifest with plugin specs.")
+    batch_parser.add_argument("-o", "--output", default=None, help="Directory in which project folders are created (default: current directory); with --archive the archive file, '-' for stdout (default: stdout).")
+    batch_parser.add_argument("-w", "--workers", type=int, default=None, help="Number of parallel workers (default: CPU count).")
+    batch_parser.add_argument("--force", action="store_true", help="Overwrite generated files even if they were modified since the last generation.")
+    batch_parser.add_argument("--fsync", choices=FSYNC_POLICIES, default="none", help="Durability of published files: no fsync, one fsync pass per project, or fsync after every file (default: none).")
+    batch_parser.add_argument("--executor", choices=BATCH_EXECUTORS, default="process", help="Worker pool type used to fan projects out; 'async' runs an asyncio pipeline with --workers concurrent projects (default: process).")
+    batch_parser.add_argument("--dry-run", action="store_true", help="Generate everything in memory on top of the existing output folder and report what would be created, updated or left alone; nothing is written to disk.")
+    batch_parser.add_argument("--archive", choices=ARCHIVE_FORMATS, default=None, help="Stream the generated projects into a single zip/tar archive instead of writing folders; projects are rendered one at a time, nothing touches the output filesystem but the archive itself.")
+    watch_parser = subparsers.add_parser("watch", help=f"Keep running and regenerate pom.xml, plugin.yml and the main class whenever a project's {PROJECT_SPEC_FILE_NAME} changes.")
+    watch_parser.add_argument("paths", nargs="*", default=["."], help=f"Project folders, or folders whose subfolders are projects (those with a {PROJECT_SPEC_FILE_NAME}); default: current directory.")
+    watch_parser.add_argument("--interval", type=float, default=WATCH_POLL_INTERVAL_SEC, help=f"Seconds between checks of the spec files (default: {WATCH_POLL_INTERVAL_SEC}).")
+    watch_parser.add_argument("--debounce", type=float, default=WATCH_DEBOUNCE_SEC, help=f"Quiet time after the last change before regenerating, so a burst of saves triggers one run (default: {WATCH_DEBOUNCE_SEC}).")
+    watch_parser.add_argument("--fsync", choices=FSYNC_POLICIES, default="none", help="Durability of regenerated files (default: none).")
+    subparsers.add_parser("logout", help=f"Forget the cached login session; the next interactive run asks for the key again (unless {KEY_ENV_VAR} or the key file provides it).")
+    index_parser = subparsers.add_parser("index", help="Inspect or refresh the offline version index (Minecraft version → API coordinates, Java level, plugin versions).")
+    index_subparsers = index_parser.add_subparsers(dest="index_command", required=True)
+    index_subparsers.add_parser("list", help="Print the targets known to the version index as JSON.")
+    index_import_parser = index_subparsers.add_parser("import", help="Add server API versions and newer Maven plugin versions found in a local Maven repository.")
+    index_import_parser.add_argument("--m2", default=os.path.join(os.path.expanduser("~"), ".m2", "repository"), metavar="DIR", help="Local Maven repository to scan (default: ~/.m2/repository).")
+    index_import_parser.add_argument("-o", "--output", default=None, metavar="FILE", help="Where to write the refreshed index (default: ~/.larendon/versions.json).")
+    return parser
+
+def main_index(args):
+    try:
+        if args.index_command == "import":
+            result = import_version_index_from_maven(args.m2, output_path=args.output)
+        else:
+            version_index = load_version_index()
+            result = {
+                "index": version_index.source_path,
+                "default": {"server": version_index.default_server, "minecraft_version": version_index.default_minecraft_version},
+                "targets": [version_index.resolve(minecraft_version, server) for server in version_index.servers() for minecraft_version in version_index.minecraft_versions()],
+            }
+    except (OSError, ValueError) as e:
+        logger.error(f"Version index command failed: {e}")
+        print(json.dumps({"error": str(e)}))
+        return 2
+    print(json.dumps(result, indent=2))
+    return 0
+
+def main_watch(args):
+    register_template_directories(args.template_dir)
+
+    def print_event(event):
+        # Jedna linia JSON na regenerację - czytelna także dla skryptów
+        print(json.dumps(event), flush=True)
+
+    watcher = ProjectWatcher(args.paths, args.interval, args.debounce, args.variant, args.fsync, print_event)
+    logger.info(f"--- Watch mode started: {', '.join(os.path.abspath(path) for path in args.paths)} ---")
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+    logger.info("--- Watch mode stopped ---")
+    return 0
+
+# Opcje trybu wsadowego bez znaczenia dla archiwum: (atrybut argparse, opcja, wartość domyślna)
+ARCHIVE_INAPPLICABLE_OPTIONS = (
+    ("workers", "--workers", None),
+    ("executor", "--executor", "process"),
+    ("force", "--force", False),
+    ("fsync", "--fsync", "none"),
+    ("dry_run", "--dry-run", False),
+    ("maven_cache", "--maven-cache", None),
+    ("skeleton", "--skeleton", "clone"),
+)
+
+def main_batch_archive(args):
+    archive_path = args.output or "-"
+    # Archiwum na stdout - podsumowanie JSON idzie wtedy na stderr, żeby nie uszkodzić strumienia
+    summary_stream = sys.stderr if archive_path == "-" else sys.stdout
+    try:
+        # Jak --dry-run z --maven-cache: opcja, której tryb nie obsługuje, to błąd, a nie cicho pominięte ustawienie
+        inapplicable_options = [option for attribute, option, default in ARCHIVE_INAPPLICABLE_OPTIONS if getattr(args, attribute) != default]
+        if inapplicable_options:
+            raise ValueError(f"{', '.join(inapplicable_options)} cannot be used with --archive: projects are rendered one at a time straight into the archive, never into folders.")
+        summary = run_archive_batch(args.manifest, archive_path, args.archive, template_directories=args.template_dir, default_variant=args.variant, spec_defaults={"minecraft_version": args.minecraft_version, "server": args.server})
+    except (OSError, ValueError) as e:
+        logger.error(f"Archive run aborted: {e}")
+        summary = {"manifest": os.path.abspath(args.manifest), "error": str(e)}
+        if isinstance(e, SpecValidationError):
+            summary["problems"] = e.problems
+        print(json.dumps(summary), file=summary_stream)
+        return 2
+    print(json.dumps(summary), file=summary_stream)
+    return 1 if summary["failed"] else 0
+
+def main_batch(args):
+    if args.archive:
+        return main_batch_archive(args)
+    output_root = args.output or "."
+    # Przebieg "na sucho": zapisy trafiają do pamięci, odczyty (istniejące projekty i manifesty) nadal z dysku
+    backend = MemoryBackend(output_root, fallback=DISK_BACKEND) if args.dry_run else None
+    try:
+        summary = run_batch_scaffolding(args.manifest, output_root, workers=args.workers, executor_kind=args.executor, template_directories=args.template_dir, default_variant=args.variant, force=args.force, fsync_policy=args.fsync, log_file_name=LOG_FILE_NAME, trace_path=args.trace, spec_defaults={"minecraft_version": args.minecraft_version, "server": args.server}, maven_cache=args.maven_cache, maven_cache_mode=args.maven_cache_mode, skeleton_mode=args.skeleton, backend=backend)
+    except (OSError, ValueError) as e:
+        logger.error(f"Batch run aborted: {e}")
+        summary = {"manifest": os.path.abspath(args.manifest), "error": str(e)}
+        if isinstance(e, SpecValidationError):
+            summary["problems"] = e.problems
+        print(json.dumps(summary))
+        return 2
+    print(json.dumps(summary))
+    return 1 if summary["failed"] else 0
+
+# --- Funkcja logowania ---
+def start_login_session():
+    try:
+        issue_session_token()
+    except OSError as e:
+        # Np. katalog domowy tylko do odczytu - logowanie działa dalej, tylko bez zapamiętanej sesji
+        logger.warning(f"Could not save the session token: {e}")
+
+def main_login_sequence(renderer):
+    # Ważna sesja z poprzedniego uruchomienia: bez animacji, czyszczenia ekranu i pytania o klucz
+    if has_valid_session():
+        logger.info("Login skipped: valid session token.")
+        return True
+    configured_key = configured_access_key()
+    if configured_key is not None:
+        if is_valid_access_key(configured_key):
+            logger.info("Login successful (configured key).")
+            start_login_session()
+            return True
+        logger.warning("Login failed: configured key is incorrect.")
+        renderer.line(f"{get_time_str()} I ", "Access", f" I Denied. The key from {KEY_ENV_VAR} or the key file is incorrect.", red_gradient_cycle, final_newline=True)
+        return False
+
+    login_ascii_art = """
+ ___      _______  _______  ___   __    _
+|   |    |       ||       ||   | |  |  | |
+|   |    |   _   ||    ___||   | |   |_| |
+|   |    |  | |  ||   | __ |   | |       |
+|   |___ |  |_|  ||   ||  ||   | |  _    |
+|       ||       ||   |_| ||   | | | |   |
+|_______||_______||_______||___| |_|  |__|
+"""
+    login_art_start_color = (139, 0, 0)
+    login_art_end_color = (255, 0, 0)
+
+    renderer.clear_screen() # Czyść ekran NA SAMYM POCZĄTKU sekwencji logowania
+    if login_ascii_art.startswith('\n'): login_ascii_art = login_ascii_art[1:]
+    renderer.art(login_ascii_art, login_art_start_color, login_art_end_color)
+    renderer.blank_lines() # Pusta linia po ASCII art
+
+    current_time_login = get_time_str()
+    login_prompt_prefix = f"{current_time_login} I "
+    login_prompt_suffix = " I Valid Key: "
+
+    # Upewnij się, że linia jest czysta przed input()
+    # renderer.line już to robi (czyści linię \r i \033[K)
+    renderer.line(login_prompt_prefix, "Login", login_prompt_suffix, red_gradient_cycle, final_newline=False) # Ważne: final_newline=False
+    entered_key = input() # input() sam przejdzie do nowej linii po Enter
+    logger.info(f"Login attempt. Key entered: {'******' if entered_key else 'EMPTY'}")
+
+    if is_valid_access_key(entered_key):
+        logger.info("Login successful.")
+        start_login_session()
+        # Krótki komunikat, który zostanie wyczyszczony
+        # final_newline=False, aby nie zostawiać pustej linii przed clear_screen
+        renderer.line(f"{get_time_str()} I ", "Access", " I Granted. Starting...", green_gradient_cycle, final_newline=False, clear_line_before=True)
+        renderer.pause(0.5) # Daj czas na przeczytanie
+        renderer.clear_screen() # Kluczowe: wyczyść ekran PRZED zwróceniem True
+        return True
+    else:
+        logger.warning("Login failed: Incorrect key.")
+        # Krótki komunikat, który zostanie wyczyszczony
+        renderer.line(f"{get_time_str()} I ", "Access", " I Denied. Exiting...", red_gradient_cycle, final_newline=False, clear_line_before=True)
+        renderer.pause(1) # Daj czas na przeczytanie
+        renderer.clear_screen() # Kluczowe: wyczyść ekran PRZED zwróceniem False
+        return False
+
+# --- Tryb interaktywny ---
+def main_interactive(cli_args):
+    register_template_directories(cli_args.template_dir)
+    try:
+        # Nieznana wersja ma zatrzymać program przed logowaniem i pytaniami, a nie po nich
+        version_target = resolve_version_target(cli_args.minecraft_version, cli_args.server)
+    except (OSError, VersionIndexError) as e:
+        logger.error(f"Version index lookup failed: {e}")
+        print(f"{get_time_str()} I Error I {e}")
+        return 2
+    renderer = select_renderer(cli_args.renderer)
+    with span("login"):
+        login_successful = main_login_sequence(renderer) # Wynik logowania zapisany do zmiennej
+
+    if not login_successful:
+        # Ekran jest już wyczyszczony przez main_login_sequence()
+        renderer.prompt_exit("Login failed. Press Enter to exit.") # Prosty komunikat na czystym ekranie
+        logger.info("--- Application Lare Terminated (Login Failed) ---")
+        return 0
+
+    # Jeśli logowanie się powiodło, ekran jest już czysty.
+    # Teraz można wyświetlić ASCII art "Lare" i kontynuować.
+    logger.info("--- Application Lare Started ---")
+    project_display_name_input = ""
+    author_name_input = ""
+    plugin_artifact_id_input = ""
+
+    final_processed_group_id = ""
+    final_processed_artifact_id = ""
+    final_processed_project_name = ""
+
+    ascii_art_text_lare = """
+  ██▓     ▄▄▄         ██▀███  ▓█████
+▓██▒    ▒████▄     ▓██ ▒ ██▒▓█   ▀
+▒██░    ▒██  ▀█▄   ▓██ ░▄█ ▒▒███  
+▒██░    ░██▄▄▄▄██  ▒██▀▀█▄   ▒▓█  ▄
+░██████▒▓█    ▓██▒░██▓ ▒██▒░▒████▒
+░ ▒░▓   ░▒▒    ▓▒█░░ ▒▓ ░▒▓░░░ ▒░ ░
+░ ░ ▒   ░ ▒    ▒▒ ░  ░▒ ░ ▒░ ░ ░  ░
+  ░ ░     ░    ▒      ░░   ░    ░   
+    ░   ░      ░  ░   ░        ░  ░
+""" # Zmieniłem nazwę zmiennej na ascii_art_text_lare dla jasności
+    art_start_color = (0, 100, 0); art_end_color = (50, 205, 50)
+    if ascii_art_text_lare.startswith('\n'): ascii_art_text_lare = ascii_art_text_lare[1:]
+    renderer.art(ascii_art_text_lare, art_start_color, art_end_color)
+    renderer.blank_lines()
+
+    current_time = get_time_str()
+    folder_prompt_prefix_text = f"{current_time} I "
+    folder_prompt_suffix_text = " I Please provide what name of folder, do you want: "
+    renderer.line(folder_prompt_prefix_text, "Info", folder_prompt_suffix_text, green_gradient_cycle, final_newline=False, log_message_override="Prompting for folder name.")
+    folder_name = input()
+    logger.info(f"User entered folder name: '{folder_name}'")
+
+    folder_created = False
+    created_folder_path = ""
+
+    if folder_name:
+        try:
+            with span("create_folder", path=folder_name):
+                os.mkdir(folder_name)
+            created_folder_path = os.path.abspath(folder_name)
+            folder_created = True
+            current_time = get_time_str()
+            msg_prefix = f"{current_time} I "; msg_suffix = " I Great! Your starter folder has been created."
+            renderer.line(msg_prefix, "Config", msg_suffix, green_gradient_cycle, final_newline=True, log_message_override=f"Folder '{created_folder_path}' created successfully.", clear_line_before=True)
+        except FileExistsError:
+            created_folder_path = os.path.abspath(folder_name)
+            folder_created = os.path.isdir(created_folder_path)
+            current_time = get_time_str()
+            if folder_created:
+                msg_prefix = f"{current_time} I "; msg_suffix = " I Folder already exists. Only changed files will be updated."
+                renderer.line(msg_prefix, "Caution", msg_suffix, caution_gradient_cycle, final_newline=True, log_level=logging.WARNING, log_message_override=f"Folder '{created_folder_path}' already exists. Regenerating incrementally.", clear_line_before=True)
+            else:
+                msg_prefix = f"{current_time} I "; msg_suffix = " I Sorry, An error occurred. A file with this name already exists."
+                renderer.line(msg_prefix, "Config", msg_suffix, red_gradient_cycle, final_newline=True, log_level=logging.WARNING, log_message_override=f"Path '{created_folder_path}' already exists and is not a folder.", clear_line_before=True)
+        except OSError as e:
+            current_time = get_time_str()
+            msg_prefix = f"{current_time} I "; msg_suffix = f" I Sorry, An error occurred: {e}"
+            renderer.line(msg_prefix, "Config", msg_suffix, red_gradient_cycle, final_newline=True, log_level=logging.ERROR, log_message_override=f"OSError when creating folder '{folder_name}': {e}", clear_line_before=True)
+    else:
+        current_time = get_time_str()
+        msg_prefix = f"{current_time} I "; msg_suffix = " I No folder name was provided. Starter folder not created."
+        renderer.line(msg_prefix, "Config", msg_suffix, red_gradient_cycle, final_newline=True, log_level=logging.WARNING, log_message_override="No folder name provided. Folder creation skipped.", clear_line_before=True)
+
+    if folder_name:
+        renderer.blank_lines(2) # Celowy odstęp, jeśli podano nazwę folderu
+
+    if folder_created:
+        current_time = get_time_str()
+        pom_info_prompt_prefix = f"{current_time} I "
+        pom_name_prompt_suffix = " I Please provide your informations about name: "
+        renderer.line(pom_info_prompt_prefix, "Info", pom_name_prompt_suffix, green_gradient_cycle, final_newline=False, log_message_override="Prompting for project display name.")
+        project_display_name_input = input()
+        logger.info(f"User entered project display name: '{project_display_name_input}'")
+
+        current_time = get_time_str()
+        pom_info_prompt_prefix = f"{current_time} I "
+        pom_author_prompt_suffix = " I Please provide your informations about author: "
+        renderer.line(pom_info_prompt_prefix, "Info", pom_author_prompt_suffix, green_gradient_cycle, final_newline=False, log_message_override="Prompting for author name.")
+        author_name_input = input()
+        logger.info(f"User entered author name: '{author_name_input}'")
+
+        current_time = get_time_str()
+        pom_info_prompt_prefix = f"{current_time} I "
+        pom_plugin_name_prompt_suffix = " I Please provide your informations about plugin name: "
+        renderer.line(pom_info_prompt_prefix, "Info", pom_plugin_name_prompt_suffix, green_gradient_cycle, final_newline=False, log_message_override="Prompting for plugin artifactId (plugin name).")
+        plugin_artifact_id_input = input()
+        logger.info(f"User entered plugin artifactId: '{plugin_artifact_id_input}'")
+
+        if project_display_name_input and author_name_input and plugin_artifact_id_input:
+            final_processed_group_id = sanitize_group_id(author_name_input)
+            final_processed_artifact_id = sanitize_artifact_id(plugin_artifact_id_input)
+
+            final_processed_project_name = project_display_name_input
+            logger.info(f"Processed POM info: GroupID='{final_processed_group_id}', ArtifactID='{final_processed_artifact_id}', ProjectName='{final_processed_project_name}'")
+
+            pom_xml_template = build_pom_xml_content(final_processed_group_id, final_processed_artifact_id, final_processed_project_name, cli_args.variant, version_target)
+            pom_file_full_path = os.path.join(created_folder_path, "pom.xml")
+            try:
+                with span("write_pom", project=created_folder_path) as pom_span:
+                    pom_io_stats = new_io_stats()
+                    # Odpowiedzi z pytań trafiają do larendon.json - później wystarczy edytować ten plik (tryb watch);
+                    # jak pom.xml jest śledzony w manifeście, więc nowe odpowiedzi go aktualizują, a edycji użytkownika nie nadpisują
+                    project_spec_content = serialize_project_spec({"name": project_display_name_input, "author": author_name_input, "artifact_id": plugin_artifact_id_input, "variant": cli_args.variant, "minecraft_version": version_target["minecraft_version"], "server": version_target["server"]})
+                    write_statuses = write_generated_files(created_folder_path, {"pom.xml": pom_xml_template, PROJECT_SPEC_FILE_NAME: project_spec_content}, io_stats=pom_io_stats)
+                    pom_write_status = write_statuses["pom.xml"]
+                    pom_span.bytes_written = pom_io_stats["bytes_written"]
+                current_time = get_time_str()
+                msg_prefix = f"{current_time} I "
+                if pom_write_status == "modified":
+                    msg_suffix = " I Your pom.xml was edited since it was generated. Left untouched."
+                    renderer.line(msg_prefix, "Caution", msg_suffix, caution_gradient_cycle, final_newline=True, log_level=logging.WARNING, log_message_override=f"pom.xml at {pom_file_full_path} was modified by the user. Not overwritten.", clear_line_before=True)
+                elif pom_write_status == "unchanged":
+                    msg_suffix = " I Your pom.xml is already up to date."
+                    renderer.line(msg_prefix, "Config", msg_suffix, green_gradient_cycle, final_newline=True, log_message_override=f"pom.xml at {pom_file_full_path} is up to date.", clear_line_before=True)
+                else:
+                    msg_suffix = " I Great! Your pom.xml has been created."
+                    renderer.line(msg_prefix, "Config", msg_suffix, green_gradient_cycle, final_newline=True, log_message_override=f"pom.xml {pom_write_status} successfully at {pom_file_full_path}", clear_line_before=True)
+                if write_statuses[PROJECT_SPEC_FILE_NAME] == "modified":
+                    msg_suffix = f" I Your {PROJECT_SPEC_FILE_NAME} was edited since it was generated. Left untouched."
+                    renderer.line(msg_prefix, "Caution", msg_suffix, caution_gradient_cycle, final_newline=True, log_level=logging.WARNING, log_message_override=f"{PROJECT_SPEC_FILE_NAME} in {created_folder_path} was modified by the user. Not overwritten.", clear_line_before=True)
+            except IOError as e:
+                current_time = get_time_str()
+                msg_prefix = f"{current_time} I "; msg_suffix = f" I Sorry, An error occurred while writing pom.xml: {e}"
+                renderer.line(msg_prefix, "Config", msg_suffix, red_gradient_cycle, final_newline=True, log_level=logging.ERROR, log_message_override=f"IOError while writing pom.xml: {e}", clear_line_before=True)
+        else:
+            current_time = get_time_str()
+            msg_prefix = f"{current_time} I "; msg_suffix = " I Not all information for pom.xml was provided. File not created."
+            renderer.line(msg_prefix, "Config", msg_suffix, red_gradient_cycle, final_newline=True, log_level=logging.WARNING, log_message_override="Not all info for pom.xml provided. File not created.", clear_line_before=True)
+            final_processed_group_id = ""
+            final_processed_artifact_id = ""
+
+        if folder_created and final_processed_group_id and final_processed_artifact_id:
+            renderer.blank_lines(2) # Celowy odstęp
+            current_time = get_time_str()
+            caution_prefix_text = f"{current_time} I "
+            caution_suffix_text = " I Do you want to proceed starter files? Yes or No: "
+            renderer.line(caution_prefix_text, "Caution", caution_suffix_text, caution_gradient_cycle, final_newline=False, log_message_override="Prompting user: proceed with starter files (Yes/No)?")
+            user_choice_starter_files = input().strip().lower()
+            logger.info(f"User choice for starter files: '{user_choice_starter_files}'")
+
+            if user_choice_starter_files == "yes":
+                with span("generate_starter_files", project=created_folder_path) as starter_span:
+                    starter_io_stats = new_io_stats()
+                    generate_starter_files_and_folders(
+                        created_folder_path,
+                        final_processed_group_id,
+                        final_processed_artifact_id,
+                        final_processed_project_name,
+                        author_name_input,
+                        renderer=renderer,
+                        variant=cli_args.variant,
+                        io_stats=starter_io_stats,
+                        version_target=version_target,
+                        skeleton_mode=cli_args.skeleton
+                    )
+                    starter_span.bytes_written = starter_io_stats["bytes_written"]
+                current_time = get_time_str()
+                done_prefix_text = f"{current_time} I "
+                done_suffix_text = " I Great! Your starter plugin folders and files are created."
+                renderer.line(done_prefix_text, "Done", done_suffix_text, done_gradient_cycle, final_newline=True, log_message_override="Starter plugin folders and files created.", clear_line_before=True)
+            elif user_choice_starter_files == "no":
+                current_time = get_time_str()
+                info_prefix_text = f"{current_time} I "
+                info_suffix_text = " I Starter files creation skipped by user."
+                renderer.line(info_prefix_text, "Info", info_suffix_text, green_gradient_cycle, final_newline=True, log_message_override="Starter files creation skipped by user.", clear_line_before=True)
+            else:
+                current_time = get_time_str()
+                error_prefix_text = f"{current_time} I "
+                error_suffix_text = " I Invalid input. Starter files creation skipped."
+                renderer.line(error_prefix_text, "Config", error_suffix_text, red_gradient_cycle, final_newline=True, log_level=logging.WARNING, log_message_override="Invalid input for starter files prompt. Creation skipped.", clear_line_before=True)
+
+            if cli_args.maven_cache:
+                current_time = get_time_str()
+                msg_prefix = f"{current_time} I "
+                try:
+                    with span("prewarm_maven_cache", project=created_folder_path) as prewarm_span:
+                        maven_cache_report = prewarm_project_maven_cache(created_folder_path, cli_args.maven_cache, cli_args.maven_cache_mode)
+                        prewarm_span.bytes_written = maven_cache_report["bytes_copied"]
+                    msg_suffix = f" I Maven cache: {len(maven_cache_report['hits'])} artifact(s) ready offline, {len(maven_cache_report['misses'])} missing."
+                    renderer.line(msg_prefix, "Config", msg_suffix, caution_gradient_cycle if maven_cache_report["misses"] else green_gradient_cycle, final_newline=True, clear_line_before=True)
+                except (OSError, ValueError) as e:
+                    msg_suffix = f" I Sorry, the Maven cache could not be prepared: {e}"
+                    renderer.line(msg_prefix, "Config", msg_suffix, red_gradient_cycle, final_newline=True, log_level=logging.ERROR, log_message_override=f"Maven cache pre-warm failed: {e}", clear_line_before=True)
+    else:
+        logger.info("Skipping POM and starter files generation as base folder was not created or an error occurred.")
+
+    logger.info("--- Application Lare Finished ---")
+    # prompt_exit czyści bieżącą linię przed input()
+    renderer.prompt_exit("\nNaciśnij Enter, aby zakończyć...")
+    return 0
+
+# --- Główny punkt wejścia ---
+def run_command(cli_args):
+    if cli_args.version_index:
+        # Przez zmienną środowiskową indeks widzą także procesy robocze trybu wsadowego
+        os.environ[VERSION_INDEX_ENV_VAR] = os.path.abspath(cli_args.version_index)
+    if cli_args.command == "index":
+        return main_index(cli_args)
+    if cli_args.command == "watch":
+        return main_watch(cli_args)
+    if cli_args.command == "logout":
+        print("Session ended." if end_session() else "No active session.")
+        return 0
+    if cli_args.command == "batch":
+        with span("batch", manifest=cli_args.manifest):
+            return main_batch(cli_args)
+    with span("interactive"):
+        return main_interactive(cli_args)
+
+def main(argv=None):
+    configure_logging()
+    cli_args = build_argument_parser().parse_args(argv)
+    trace_sink = TRACER.add_sink(JsonLinesSink(cli_args.trace)) if cli_args.trace else None
+    try:
+        if cli_args.profile:
+            with profiled(cli_args.profile):
+                return run_command(cli_args)
+        return run_command(cli_args)
+    finally:
+        if trace_sink:
+            TRACER.remove_sink(trace_sink)
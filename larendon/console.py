@@ -0,0 +1,301 @@
+import contextlib
+import datetime
+import functools
+import logging
+import re
+import sys
+import time
+
+from larendon.progress import PROGRESS_REFRESH_HZ, ProgressTracker, format_eta
+
+logger = logging.getLogger(__name__)
+
+# --- Funkcja do czyszczenia ekranu konsoli (sekwencje ANSI zamiast uruchamiania "clear"/"cls" w podprocesie) ---
+CLEAR_SCREEN_SEQUENCE = "\033[H\033[2J\033[3J"
+
+def clear_screen():
+    """Czyści ekran konsoli (razem z historią przewijania, jak "clear")."""
+    sys.stdout.write(CLEAR_SCREEN_SEQUENCE)
+    sys.stdout.flush()
+
+# --- Rozmiar cache'y z gotowymi sekwencjami ANSI (najdawniej używane wpisy są usuwane) ---
+GRADIENT_CACHE_SIZE = 512
+
+# --- Funkcja do drukowania tekstu z pionowym gradientem (dla ASCII art) ---
+@functools.lru_cache(maxsize=32)
+def render_vertical_gradient_text(text, start_color_rgb, end_color_rgb):
+    lines = text.splitlines()
+    num_lines = len(lines)
+    if num_lines == 0: return ""
+    rendered_lines = []
+    for i, line in enumerate(lines):
+        ratio = i / (num_lines - 1) if num_lines > 1 else 0
+        r = int(start_color_rgb[0] * (1 - ratio) + end_color_rgb[0] * ratio)
+        g = int(start_color_rgb[1] * (1 - ratio) + end_color_rgb[1] * ratio)
+        b = int(start_color_rgb[2] * (1 - ratio) + end_color_rgb[2] * ratio)
+        rendered_lines.append(f"\033[38;2;{r};{g};{b}m{line}\033[0m\n")
+    return "".join(rendered_lines)
+
+def print_vertical_gradient_text(text, start_color_rgb, end_color_rgb):
+    rendered_text = render_vertical_gradient_text(text, tuple(start_color_rgb), tuple(end_color_rgb))
+    if not rendered_text: return
+    sys.stdout.write(rendered_text)
+    sys.stdout.flush()
+
+# --- Funkcja do aplikowania poziomego gradientu do pojedynczego słowa ---
+@functools.lru_cache(maxsize=GRADIENT_CACHE_SIZE)
+def apply_horizontal_gradient_to_word(word, color1_rgb, color2_rgb):
+    n = len(word)
+    if n == 0: return ""
+    if n == 1:
+        r, g, b = color1_rgb
+        return f"\033[38;2;{r};{g};{b}m{word}\033[0m"
+    colored_chars = []
+    for i, char in enumerate(word):
+        ratio = i / (n - 1)
+        r = int(color1_rgb[0] * (1 - ratio) + color2_rgb[0] * ratio)
+        g = int(color1_rgb[1] * (1 - ratio) + color2_rgb[1] * ratio)
+        b = int(color1_rgb[2] * (1 - ratio) + color2_rgb[2] * ratio)
+        colored_chars.append(f"\033[38;2;{r};{g};{b}m{char}")
+    colored_chars.append("\033[0m")
+    return "".join(colored_chars)
+
+# --- Funkcja zwracająca gotowe klatki animacji słowa dla danego cyklu gradientów ---
+@functools.lru_cache(maxsize=GRADIENT_CACHE_SIZE)
+def animated_word_frames(animated_word, gradient_cycle, total_frames):
+    # Klatki zależą tylko od słowa i (stałego) cyklu kolorów, więc liczymy je raz na całą sesję
+    num_color_states = len(gradient_cycle)
+    frames = []
+    for frame in range(total_frames):
+        color_state_index = (frame * num_color_states // total_frames) % num_color_states
+        current_gradient_start, current_gradient_end = gradient_cycle[color_state_index]
+        frames.append(apply_horizontal_gradient_to_word(animated_word, current_gradient_start, current_gradient_end))
+    final_gradient_start, final_gradient_end = gradient_cycle[0]
+    return tuple(frames), apply_horizontal_gradient_to_word(animated_word, final_gradient_start, final_gradient_end)
+
+# --- Funkcja zapisująca do logu treść wyświetlanej linii ---
+LOG_TIMESTAMP_PREFIX_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} I ')
+
+def log_animated_line_message(prefix_text, animated_word, suffix_text, log_level=logging.INFO, log_message_override=None):
+    if not logger.isEnabledFor(log_level):
+        return
+    log_content = f"{prefix_text.strip()} {animated_word} {suffix_text.strip()}"
+    if log_message_override:
+        log_content = log_message_override
+    cleaned_log_content = LOG_TIMESTAMP_PREFIX_PATTERN.sub('', log_content)
+    cleaned_log_content = cleaned_log_content.replace(f"{animated_word} I", "").strip()
+    logger.log(log_level, cleaned_log_content)
+
+# --- Funkcja do wyświetlania animowanej linii (dla Info/Config/Caution/Done) ---
+def print_animated_line(prefix_text, animated_word, suffix_text, gradient_cycle, duration_sec, fps, final_newline=False, log_level=logging.INFO, log_message_override=None, clear_line_before=False):
+    log_animated_line_message(prefix_text, animated_word, suffix_text, log_level, log_message_override)
+
+    # Każda klatka to dokładnie jedno sys.stdout.write (tanie przy wolnym SSH i w logach CI)
+    pending_clear = "\r\033[K" if clear_line_before else ""
+    line_end = "\033[K\n" if final_newline else "\033[K"
+    total_frames = int(duration_sec * fps)
+    num_color_states = len(gradient_cycle)
+    if num_color_states == 0:
+        sys.stdout.write(f"{pending_clear}\r{prefix_text}{animated_word}{suffix_text}{line_end}")
+        sys.stdout.flush()
+        return
+
+    frames, final_colored_word = animated_word_frames(animated_word, tuple(gradient_cycle), total_frames)
+    frame_delay = 1.0 / fps if fps > 0 else 0.01
+    for colored_animated_word in frames:
+        sys.stdout.write(f"{pending_clear}\r{prefix_text}{colored_animated_word}{suffix_text}\033[K")
+        sys.stdout.flush()
+        pending_clear = ""
+        time.sleep(frame_delay)
+
+    # Zawsze czyść linię przed finalnym wypisaniem, aby uniknąć artefaktów z input()
+    sys.stdout.write(f"{pending_clear}\r{prefix_text}{final_colored_word}{suffix_text}{line_end}")
+    sys.stdout.flush()
+
+
+# --- Funkcja pobierająca aktualny czas jako string ---
+def get_time_str():
+    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+# --- Definicje kolorów gradientów ---
+green_dark_anim = (0, 120, 0)
+green_medium_anim = (0, 200, 0)
+green_bright_anim = (80, 255, 80)
+green_gradient_cycle = [
+    (green_dark_anim, green_medium_anim), (green_medium_anim, green_bright_anim),
+    (green_bright_anim, green_medium_anim), (green_medium_anim, green_dark_anim)
+]
+red_dark_anim = (120, 0, 0)
+red_medium_anim = (200, 0, 0)
+red_bright_anim = (255, 80, 80)
+red_gradient_cycle = [
+    (red_dark_anim, red_medium_anim), (red_medium_anim, red_bright_anim),
+    (red_bright_anim, red_medium_anim), (red_medium_anim, red_dark_anim)
+]
+yellow_dark_anim = (200, 100, 0)
+yellow_medium_anim = (255, 165, 0)
+yellow_bright_anim = (255, 200, 50)
+caution_gradient_cycle = [
+    (yellow_dark_anim, yellow_medium_anim), (yellow_medium_anim, yellow_bright_anim),
+    (yellow_bright_anim, yellow_medium_anim), (yellow_medium_anim, yellow_dark_anim)
+]
+done_gradient_cycle = green_gradient_cycle
+
+# Parametry animacji
+ANIM_DURATION = 0.8 # Skróciłem trochę dla szybszego feedbacku przy logowaniu
+ANIM_FPS = 25
+
+# --- Globalny licznik dla efektu migotania wskaźnika postępu ---
+progress_shimmer_colors = [
+    (green_dark_anim, green_medium_anim),
+    (green_medium_anim, green_bright_anim),
+    (green_bright_anim, green_medium_anim)
+]
+
+# --- Renderery: oddzielenie wyświetlania od właściwego generowania ---
+class AnimatedRenderer:
+    """Renderer dla terminala: animowane gradienty, migoczący postęp i pauzy na przeczytanie."""
+
+    def clear_screen(self):
+        clear_screen()
+
+    def art(self, text, start_color_rgb, end_color_rgb):
+        print_vertical_gradient_text(text, start_color_rgb, end_color_rgb)
+
+    def blank_lines(self, count=1):
+        sys.stdout.write("\n" * count)
+        sys.stdout.flush()
+
+    def line(self, prefix_text, animated_word, suffix_text, gradient_cycle, final_newline=False, log_level=logging.INFO, log_message_override=None, clear_line_before=False):
+        print_animated_line(prefix_text, animated_word, suffix_text, gradient_cycle, ANIM_DURATION, ANIM_FPS, final_newline=final_newline, log_level=log_level, log_message_override=log_message_override, clear_line_before=clear_line_before)
+
+    def pause(self, seconds):
+        time.sleep(seconds)
+
+    # Linię postępu rysuje wątek w tle (ProgressTracker), zadania jedynie aktualizują liczniki
+    progress_tracker = None
+    progress_refresh_hz = PROGRESS_REFRESH_HZ
+
+    def begin_progress(self, total_tasks_count=0):
+        print()
+        self.progress_tracker = ProgressTracker(total_tasks_count, self.draw_progress, self.progress_refresh_hz).start()
+
+    def draw_progress(self, progress, final):
+        refresh_col1, refresh_col2 = progress_shimmer_colors[progress["frame"] % len(progress_shimmer_colors)]
+        animated_refresh_char = apply_horizontal_gradient_to_word("↺", refresh_col1, refresh_col2)
+
+        percent_col1, percent_col2 = progress_shimmer_colors[(progress["frame"] + 1) % len(progress_shimmer_colors)]
+        animated_percent_str = apply_horizontal_gradient_to_word(f"{progress['percent']}%", percent_col1, percent_col2)
+
+        max_desc_len = 30
+        task_description = progress["description"]
+        display_desc = task_description if len(task_description) <= max_desc_len else task_description[:max_desc_len-3] + "..."
+        progress_line = f"{animated_refresh_char} │ Creating: {animated_percent_str} {progress['done']}/{progress['total']} · {progress['rate']:.1f}/s · ETA {format_eta(progress['eta_sec'])} ({display_desc})"
+        sys.stdout.write(f"\r{progress_line}\033[K")
+        sys.stdout.flush()
+
+    def task_progress(self, task_description, completed_tasks_count, total_tasks_count):
+        if self.progress_tracker is not None:
+            self.progress_tracker.update(completed_tasks_count, task_description, total_tasks_count)
+
+    def task_error(self, error_message):
+        with self.progress_tracker.lock if self.progress_tracker is not None else contextlib.nullcontext():
+            sys.stdout.write(f"\r\033[K")
+            print(f"{get_time_str()} I Error I {error_message}")
+
+    def end_progress(self):
+        if self.progress_tracker is not None:
+            self.progress_tracker.stop()
+            self.progress_tracker = None
+        sys.stdout.write(f"\r\033[K")
+        sys.stdout.flush()
+
+    def prompt_exit(self, message):
+        sys.stdout.write(f"\r\033[K")
+        sys.stdout.flush()
+        input(message)
+
+
+class PlainRenderer(AnimatedRenderer):
+    """Renderer bez kolorów, animacji i pauz (np. dla prostych terminali lub logów CI)."""
+
+    def clear_screen(self):
+        pass
+
+    def art(self, text, start_color_rgb, end_color_rgb):
+        sys.stdout.write(text if text.endswith("\n") else text + "\n")
+        sys.stdout.flush()
+
+    def line(self, prefix_text, animated_word, suffix_text, gradient_cycle, final_newline=False, log_level=logging.INFO, log_message_override=None, clear_line_before=False):
+        log_animated_line_message(prefix_text, animated_word, suffix_text, log_level, log_message_override)
+        sys.stdout.write(f"{prefix_text}{animated_word}{suffix_text}" + ("\n" if final_newline else ""))
+        sys.stdout.flush()
+
+    def pause(self, seconds):
+        pass
+
+    # Zwykłe linie zamiast nadpisywania: co najwyżej jedna na sekundę i tylko gdy postęp się zmienił
+    progress_refresh_hz = 1
+    last_drawn_done_count = 0
+
+    def begin_progress(self, total_tasks_count=0):
+        self.last_drawn_done_count = 0
+        super().begin_progress(total_tasks_count)
+
+    def draw_progress(self, progress, final):
+        if progress["done"] == self.last_drawn_done_count and not final: return
+        self.last_drawn_done_count = progress["done"]
+        sys.stdout.write(f"Creating: {progress['percent']}% {progress['done']}/{progress['total']} · {progress['rate']:.1f}/s · ETA {format_eta(progress['eta_sec'])} ({progress['description']})\n")
+        sys.stdout.flush()
+
+    def task_error(self, error_message):
+        with self.progress_tracker.lock if self.progress_tracker is not None else contextlib.nullcontext():
+            print(f"{get_time_str()} I Error I {error_message}")
+
+    def end_progress(self):
+        if self.progress_tracker is not None:
+            self.progress_tracker.stop()
+            self.progress_tracker = None
+
+    def prompt_exit(self, message):
+        input(message)
+
+
+class NullRenderer(PlainRenderer):
+    """Renderer, który niczego nie wyświetla - czas generowania zależy wyłącznie od operacji dyskowych."""
+
+    def art(self, text, start_color_rgb, end_color_rgb):
+        pass
+
+    def blank_lines(self, count=1):
+        pass
+
+    def line(self, prefix_text, animated_word, suffix_text, gradient_cycle, final_newline=False, log_level=logging.INFO, log_message_override=None, clear_line_before=False):
+        log_animated_line_message(prefix_text, animated_word, suffix_text, log_level, log_message_override)
+
+    def begin_progress(self, total_tasks_count=0):
+        pass
+
+    def task_progress(self, task_description, completed_tasks_count, total_tasks_count):
+        pass
+
+    def task_error(self, error_message):
+        pass
+
+    def prompt_exit(self, message):
+        pass
+
+
+RENDERER_CHOICES = ("auto", "animated", "plain", "null")
+
+def select_renderer(renderer_name="auto"):
+    if renderer_name == "auto":
+        # Bez terminala animacje tylko spowalniają - np. przy przekierowaniu wyjścia do pliku
+        renderer_name = "animated" if sys.stdout.isatty() else "null"
+    if renderer_name == "animated":
+        return AnimatedRenderer()
+    if renderer_name == "plain":
+        return PlainRenderer()
+    if renderer_name == "null":
+        return NullRenderer()
+    raise ValueError(f"Unknown renderer '{renderer_name}'. Use one of: {', '.join(RENDERER_CHOICES)}.")
@@ -0,0 +1,120 @@
+import base64
+import contextlib
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import time
+
+logger = logging.getLogger(__name__)
+
+# --- Dane logowania: klucz dostępu z wiersza poleceń, zmiennej środowiskowej albo pliku, sesja w lokalnym tokenie ---
+# W kodzie jest tylko skrót SHA-256 klucza - sam klucz nie jest już zapisany w źródłach
+ACCESS_KEY_SHA256 = "1de20282dcb83c01b262ca2eec4b7279711d3ab645490ce0954b5418a4b1f05b"
+CREDENTIALS_DIR = os.path.join(os.path.expanduser("~"), ".larendon")
+KEY_ENV_VAR = "LARENDON_KEY"
+KEY_FILE_ENV_VAR = "LARENDON_KEY_FILE"
+DEFAULT_KEY_FILE_PATH = os.path.join(CREDENTIALS_DIR, "key")
+SESSION_FILE_PATH = os.path.join(CREDENTIALS_DIR, "session")
+SESSION_SECRET_FILE_PATH = os.path.join(CREDENTIALS_DIR, "session.secret")
+SESSION_TTL_SEC = 12 * 60 * 60
+SESSION_TOKEN_VERSION = 1
+# Tolerancja przesunięcia zegara dla czasu wystawienia tokenu
+SESSION_CLOCK_SKEW_SEC = 60
+
+def is_valid_access_key(key):
+    return hmac.compare_digest(hashlib.sha256(key.encode("utf-8")).hexdigest(), ACCESS_KEY_SHA256)
+
+def read_private_file(file_path):
+    with open(file_path, "rb") as f:
+        if os.name != "nt" and os.fstat(f.fileno()).st_mode & 0o077:
+            logger.warning(f"'{file_path}' is readable by other users; restrict it with: chmod 600 {file_path}")
+        return f.read()
+
+def write_private_file(file_path, data):
+    # Plik powstaje od razu z prawami 0600 i podmienia poprzedni atomowo - nigdy nie istnieje w wersji czytelnej dla innych
+    os.makedirs(os.path.dirname(file_path), mode=0o700, exist_ok=True)
+    temporary_path = f"{file_path}.{os.getpid()}.tmp"
+    fd = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o600)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temporary_path, file_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(temporary_path)
+        raise
+
+def configured_access_key():
+    """Klucz do logowania bez pytania: zmienna LARENDON_KEY, plik z LARENDON_KEY_FILE albo ~/.larendon/key (None, gdy brak)."""
+    if os.environ.get(KEY_ENV_VAR):
+        return os.environ[KEY_ENV_VAR].strip()
+    key_file_path = os.environ.get(KEY_FILE_ENV_VAR) or DEFAULT_KEY_FILE_PATH
+    try:
+        return read_private_file(key_file_path).decode("utf-8").strip() or None
+    except FileNotFoundError:
+        if os.environ.get(KEY_FILE_ENV_VAR):
+            logger.warning(f"Key file '{key_file_path}' from {KEY_FILE_ENV_VAR} does not exist.")
+        return None
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Ignoring unreadable key file '{key_file_path}': {e}")
+        return None
+
+# --- Token sesji: ładunek JSON podpisany HMAC-SHA256 sekretem tej instalacji, ważny SESSION_TTL_SEC ---
+def load_session_secret(create=False):
+    try:
+        secret = read_private_file(SESSION_SECRET_FILE_PATH)
+        if len(secret) >= 32:
+            return secret
+    except FileNotFoundError:
+        pass
+    if not create:
+        return None
+    secret = secrets.token_bytes(32)
+    write_private_file(SESSION_SECRET_FILE_PATH, secret)
+    return secret
+
+def sign_session_payload(encoded_payload, secret):
+    return hmac.new(secret, encoded_payload.encode("ascii"), hashlib.sha256).hexdigest()
+
+def issue_session_token(ttl_sec=SESSION_TTL_SEC, now=None):
+    now = time.time() if now is None else now
+    payload = {"v": SESSION_TOKEN_VERSION, "iat": int(now), "exp": int(now + ttl_sec), "key": ACCESS_KEY_SHA256[:16]}
+    encoded_payload = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode("utf-8")).decode("ascii").rstrip("=")
+    token = f"{encoded_payload}.{sign_session_payload(encoded_payload, load_session_secret(create=True))}"
+    write_private_file(SESSION_FILE_PATH, token.encode("ascii"))
+    logger.info(f"Session token issued, valid for {ttl_sec // 60} min.")
+    return token
+
+def verify_session_token(token, secret, now=None):
+    now = time.time() if now is None else now
+    encoded_payload, _, signature = token.strip().partition(".")
+    if not signature or not hmac.compare_digest(sign_session_payload(encoded_payload, secret), signature):
+        return False
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(encoded_payload + "=" * (-len(encoded_payload) % 4)))
+        # Zmiana klucza dostępu (inny skrót w kodzie) unieważnia wszystkie wcześniejsze sesje
+        return payload["v"] == SESSION_TOKEN_VERSION and payload["key"] == ACCESS_KEY_SHA256[:16] and payload["iat"] - SESSION_CLOCK_SKEW_SEC <= now < payload["exp"]
+    except (ValueError, TypeError, KeyError):
+        return False
+
+def has_valid_session():
+    try:
+        secret = load_session_secret()
+        if secret is None:
+            return False
+        return verify_session_token(read_private_file(SESSION_FILE_PATH).decode("ascii"), secret)
+    except FileNotFoundError:
+        return False
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Ignoring unreadable session token: {e}")
+        return False
+
+def end_session():
+    try:
+        os.remove(SESSION_FILE_PATH)
+        return True
+    except FileNotFoundError:
+        return False
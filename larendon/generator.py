@@ -0,0 +1,246 @@
+import logging
+import os
+
+from larendon.backends import DISK_BACKEND, DiskBackend
+from larendon.incremental import load_generation_manifest, new_generation_report, save_generation_manifest, write_generated_file
+from larendon.instrumentation import span
+from larendon.mavencache import maven_cache_stats_from_report, merge_maven_cache_stats, new_maven_cache_stats, prewarm_project_maven_cache
+from larendon.naming import java_package_segments, sanitize_artifact_id, sanitize_group_id, to_camel_case_for_class
+from larendon.skeleton import clone_skeleton_into, select_skeleton, skeleton_file_contents
+from larendon.specs import stage_project_spec_file
+from larendon.taskgraph import TASK_GRAPH_WORKERS, TaskGraph
+from larendon.templating import TEMPLATE_REGISTRY
+from larendon.validation import validate_plugin_spec
+from larendon.versions import resolve_version_target
+from larendon.writer import encode_generated_content, merge_io_stats, new_io_stats
+
+logger = logging.getLogger(__name__)
+
+# --- Funkcja budująca zawartość pom.xml ---
+def build_pom_xml_content(group_id, artifact_id, project_name, variant=None, version_target=None):
+    if version_target is None:
+        version_target = resolve_version_target()
+    return TEMPLATE_REGISTRY.render("pom.xml", dict(version_target, group_id=group_id, artifact_id=artifact_id, project_name=project_name), variant)
+
+# --- Funkcja planująca startowe foldery i pliki (bez żadnych operacji na dysku) ---
+def plan_starter_files(group_id_str, artifact_id_str, project_display_name, author_original_name, variant=None, version_target=None):
+    if version_target is None:
+        version_target = resolve_version_target()
+    full_package_as_list = java_package_segments(group_id_str, artifact_id_str)
+    java_package_relative_dir = "/".join(["src", "main", "java"] + full_package_as_list)
+    resources_relative_dir = "src/main/resources"
+
+    main_class_name_java = to_camel_case_for_class(artifact_id_str)
+    main_class_filename = f"{main_class_name_java}.java"
+    fully_qualified_main_class = ".".join(full_package_as_list + [main_class_name_java])
+
+    plugin_yml_content_str = TEMPLATE_REGISTRY.render("plugin.yml", {
+        "project_display_name": project_display_name,
+        "main_class": fully_qualified_main_class,
+        "author": author_original_name,
+        "api_version": version_target["api_version"],
+    }, variant)
+    main_java_file_content_str = TEMPLATE_REGISTRY.render("MainClass.java", {
+        "package_name": ".".join(full_package_as_list),
+        "main_class_name": main_class_name_java,
+        "project_display_name": project_display_name,
+    }, variant)
+
+    return {
+        # Foldery bez wartości zależnych od projektu - trafiają do szkieletu wariantu
+        "invariant_directories": ["src/main/java", resources_relative_dir],
+        "directories": [
+            ("Directories: src/main/java/... (package structure)", java_package_relative_dir),
+            ("Directory: src/main/resources", resources_relative_dir),
+        ],
+        "files": [
+            ("File: plugin.yml", f"{resources_relative_dir}/plugin.yml", plugin_yml_content_str),
+            (f"File: {main_class_filename}", f"{java_package_relative_dir}/{main_class_filename}", main_java_file_content_str),
+        ],
+    }
+
+# --- Graf zadań dla planu: pliki zależą tylko od katalogów, w których leżą ---
+def build_starter_task_graph(base_path, starter_plan, generation_manifest, project_writer, generation_report=None, force=False, variant=None, skeleton_mode="clone"):
+    task_graph = TaskGraph()
+    skeleton = select_skeleton(base_path, variant, starter_plan.get("invariant_directories", ()), skeleton_mode, project_writer.backend)
+
+    def run_traced(task_description, task_action):
+        with span("task", description=task_description, project=base_path) as task_span:
+            task_span.bytes_written = task_action() or 0
+
+    def ensure_directory(relative_dir):
+        project_writer.ensure_directory(relative_dir)
+        logger.info(f"Ensured directory exists: {os.path.join(base_path, *relative_dir.split('/'))}")
+
+    def write_file(relative_path, content):
+        status = write_generated_file(base_path, relative_path, content, generation_manifest, project_writer, generation_report, force)
+        return len(encode_generated_content(content)) if status in ("created", "updated") else 0
+
+    def clone_skeleton():
+        clone_skeleton_into(project_writer, skeleton, generation_manifest, generation_report, skeleton_mode == "hardlink")
+        return 0  # Klonowane bajty nie są zapisywane przez proces (liczniki files_cloned/bytes_cloned)
+
+    directory_task_names = []
+    planned_files = list(starter_plan["files"])
+    if skeleton is not None:
+        task_graph.add("skeleton", "Skeleton: invariant files and folders", lambda: run_traced("Skeleton: invariant files and folders", clone_skeleton))
+        directory_task_names.extend((relative_dir, "skeleton") for relative_dir in skeleton.directories)
+        directory_task_names.extend((relative_path.rpartition("/")[0], "skeleton") for relative_path in skeleton.files if "/" in relative_path)
+    else:
+        planned_files.extend((f"File: {relative_path}", relative_path, content) for relative_path, content in skeleton_file_contents(variant).items())
+    for task_description, relative_dir in starter_plan["directories"]:
+        if skeleton is not None and relative_dir in skeleton.directories: continue
+        task_name = f"dir:{relative_dir}"
+        task_graph.add(task_name, task_description, lambda task_description=task_description, relative_dir=relative_dir: run_traced(task_description, lambda: ensure_directory(relative_dir)))
+        directory_task_names.append((relative_dir, task_name))
+    for task_description, relative_path, content in planned_files:
+        parent_dir = relative_path.rpartition("/")[0]
+        dependencies = sorted({task_name for relative_dir, task_name in directory_task_names if parent_dir == relative_dir or parent_dir.startswith(relative_dir + "/")})
+        task_graph.add(f"file:{relative_path}", task_description, lambda task_description=task_description, relative_path=relative_path, content=content: run_traced(task_description, lambda: write_file(relative_path, content)), dependencies)
+    return task_graph
+
+# --- Funkcja generująca startowe foldery i pliki ---
+def generate_starter_files_and_folders(base_path, group_id_str, artifact_id_str, project_display_name, author_original_name, interactive=True, renderer=None, variant=None, generation_report=None, force=False, project_writer=None, fsync_policy="none", io_stats=None, generation_manifest=None, task_workers=TASK_GRAPH_WORKERS, version_target=None, skeleton_mode="clone", backend=None):
+    logger.info(f"Starting generation of project files in '{base_path}' for {project_display_name} by {author_original_name}")
+    with span("render", project=base_path):
+        starter_plan = plan_starter_files(group_id_str, artifact_id_str, project_display_name, author_original_name, variant, version_target)
+
+    # Własny writer publikujemy na końcu; writer przekazany z zewnątrz publikuje wywołujący (i wyznacza backend)
+    owns_project_writer = project_writer is None
+    if owns_project_writer:
+        project_writer = (backend or DISK_BACKEND).open_project_writer(base_path, fsync_policy)
+    if generation_manifest is None:
+        generation_manifest = load_generation_manifest(base_path, project_writer.backend)
+    if generation_report is None:
+        generation_report = new_generation_report()
+
+    task_graph = build_starter_task_graph(base_path, starter_plan, generation_manifest, project_writer, generation_report, force, variant, skeleton_mode)
+    total_tasks_count = len(task_graph)
+    completed_tasks_count = 0
+    if renderer is None or not interactive:
+        # Warstwa konsoli jest ładowana dopiero wtedy, gdy jest potrzebna - import biblioteki pozostaje szybki
+        from larendon.console import NullRenderer
+        renderer = NullRenderer()
+
+    def report_task_done(task):
+        nonlocal completed_tasks_count
+        if task.outcome == "ok":
+            completed_tasks_count += 1
+        elif task.outcome == "error":
+            error_message = f"Task '{task.description}' failed: {task.error}"
+            logger.error(error_message)
+            renderer.task_error(error_message)
+        else:
+            renderer.task_error(f"Task '{task.description}' skipped: {task.error}")
+        renderer.task_progress(task.description, completed_tasks_count, total_tasks_count)
+
+    renderer.begin_progress(total_tasks_count)
+    try:
+        finished_tasks = task_graph.run(task_workers, report_task_done)
+        failed_tasks = [task for task in finished_tasks if task.outcome == "error"]
+        if failed_tasks and not interactive:
+            raise failed_tasks[0].error
+
+        save_generation_manifest(base_path, generation_manifest, project_writer)
+        if owns_project_writer:
+            with span("publish", project=base_path):
+                project_writer.commit()
+    except BaseException:
+        # Także Ctrl-C: nic z tego przebiegu nie trafia do folderu projektu
+        if owns_project_writer:
+            project_writer.abort()
+        raise
+    finally:
+        # Zatrzymuje także wątek rysujący postęp, jeśli generowanie zostało przerwane
+        renderer.end_progress()
+        if owns_project_writer and io_stats is not None:
+            merge_io_stats(io_stats, project_writer.stats)
+    logger.info(f"Finished generation of project files ({len(generation_report['created'])} created, {len(generation_report['updated'])} updated, {len(generation_report['unchanged'])} unchanged, {len(generation_report['modified'])} modified by user).")
+    return generation_report
+
+# --- Przygotowanie i publikacja całego projektu: jedna ścieżka dla generate(), trybu wsadowego, watch i potoku asyncio ---
+def stage_and_publish_project(spec, project_writer, default_variant=None, force=False, task_workers=TASK_GRAPH_WORKERS, skeleton_mode="clone", adopt_spec_file=False):
+    """Zapisuje pom.xml, larendon.json i pliki startowe do writera i publikuje je razem; przy błędzie nic nie trafia do folderu projektu.
+
+    Funkcja blokująca (odczyty manifestu, graf zadań, publikacja) - potok asyncio wywołuje ją przez asyncio.to_thread.
+    """
+    project_path = project_writer.base_path
+    group_id = sanitize_group_id(spec["author"])
+    artifact_id = sanitize_artifact_id(spec["artifact_id"])
+    variant = spec.get("variant") or default_variant
+    version_target = resolve_version_target(spec.get("minecraft_version"), spec.get("server"))
+    generation_report = new_generation_report()
+    try:
+        generation_manifest = load_generation_manifest(project_path, project_writer.backend)
+        with span("render", project=project_path):
+            pom_xml_content = build_pom_xml_content(group_id, artifact_id, spec["name"], variant, version_target)
+        with span("task", description="File: pom.xml", project=project_path) as task_span:
+            write_generated_file(project_path, "pom.xml", pom_xml_content, generation_manifest, project_writer, generation_report, force)
+            task_span.bytes_written = project_writer.stats["bytes_written"]
+        # Wersje zapisane w pliku specyfikacji są rozwiązane - regeneracja nie zmieni ich po zmianie domyślnych w indeksie
+        stage_project_spec_file(project_writer, project_path, dict(spec, variant=variant, minecraft_version=version_target["minecraft_version"], server=version_target["server"]), generation_manifest, generation_report, force, adopt_spec_file)
+        generate_starter_files_and_folders(project_path, group_id, artifact_id, spec["name"], spec["author"], interactive=False, variant=variant, generation_report=generation_report, force=force, project_writer=project_writer, generation_manifest=generation_manifest, task_workers=task_workers, version_target=version_target, skeleton_mode=skeleton_mode)
+        with span("publish", project=project_path):
+            project_writer.commit()
+    except BaseException:
+        project_writer.abort()
+        raise
+    return generation_report
+
+def prewarm_published_project(project_path, maven_cache, maven_cache_mode="copy", fsync_policy="none"):
+    # Po publikacji: repozytorium Mavena projektu nie jest częścią plików generowanych przez szablony
+    with span("prewarm_maven_cache", project=project_path) as prewarm_span:
+        maven_cache_report = prewarm_project_maven_cache(project_path, maven_cache, maven_cache_mode, fsync_policy)
+        prewarm_span.bytes_written = maven_cache_report["bytes_copied"]
+    return maven_cache_report
+
+def check_backend_options(backend, maven_cache=None):
+    if maven_cache and not isinstance(backend, DiskBackend):
+        raise ValueError(f"Maven cache pre-warm needs a real project folder; it is not available with the {backend.name} backend.")
+
+# --- Tryb wsadowy: generowanie pojedynczego projektu bez interakcji ---
+def scaffold_project_from_spec(spec, output_root, default_variant=None, force=False, fsync_policy="none", io_stats=None, task_workers=TASK_GRAPH_WORKERS, maven_cache=None, maven_cache_mode="copy", maven_cache_stats=None, skeleton_mode="clone", backend=None, adopt_spec_file=False):
+    if backend is None:
+        backend = DISK_BACKEND
+    check_backend_options(backend, maven_cache)
+    project_path = os.path.abspath(os.path.join(output_root, spec["folder"]))
+    with span("project", project=project_path) as project_span:
+        # Jeden writer na projekt: pom.xml i pliki startowe są publikowane razem, jedną zmianą nazwy
+        project_writer = backend.open_project_writer(project_path, fsync_policy)
+        generation_report = stage_and_publish_project(spec, project_writer, default_variant, force, task_workers, skeleton_mode, adopt_spec_file)
+        project_span.bytes_written = project_writer.stats["bytes_written"]
+    if io_stats is not None:
+        merge_io_stats(io_stats, project_writer.stats)
+    if maven_cache:
+        maven_cache_report = prewarm_published_project(project_path, maven_cache, maven_cache_mode, fsync_policy)
+        if maven_cache_stats is not None:
+            merge_maven_cache_stats(maven_cache_stats, maven_cache_stats_from_report(maven_cache_report))
+    logger.info(f"Project '{project_path}' generated.")
+    return generation_report
+
+# --- Publiczne API: wygenerowanie jednego projektu w bieżącym procesie ---
+def generate(spec, output_root=".", default_variant=None, force=False, fsync_policy="none", maven_cache=None, maven_cache_mode="copy", skeleton_mode="clone", backend=None):
+    """Generuje projekt opisany specyfikacją (name, author, artifact_id, opcjonalnie folder, variant, minecraft_version i server) bez żadnych pytań.
+    backend (np. MemoryBackend) wskazuje, dokąd trafia projekt - domyślnie na dysk."""
+    # Te same sprawdzenia co w trybie wsadowym - m.in. folder nie może wskazywać poza output_root
+    with span("validate"):
+        spec = validate_plugin_spec(spec)
+    io_stats = new_io_stats()
+    maven_cache_stats = new_maven_cache_stats() if maven_cache else None
+    generation_report = scaffold_project_from_spec(spec, output_root, default_variant, force, fsync_policy, io_stats, maven_cache=maven_cache, maven_cache_mode=maven_cache_mode, maven_cache_stats=maven_cache_stats, skeleton_mode=skeleton_mode, backend=backend)
+    result = {"folder": spec["folder"], "project_path": os.path.abspath(os.path.join(output_root, spec["folder"])), "files": generation_report, "io": io_stats}
+    if maven_cache_stats is not None:
+        result["maven_cache"] = maven_cache_stats
+    return result
+
+# --- Plan całego projektu (pom.xml + pliki startowe) na podstawie specyfikacji ---
+def plan_project_from_spec(spec, output_root, default_variant=None):
+    group_id = sanitize_group_id(spec["author"])
+    artifact_id = sanitize_artifact_id(spec["artifact_id"])
+    variant = spec.get("variant") or default_variant
+    version_target = resolve_version_target(spec.get("minecraft_version"), spec.get("server"))
+    project_plan = plan_starter_files(group_id, artifact_id, spec["name"], spec["author"], variant, version_target)
+    project_plan["files"].insert(0, ("File: pom.xml", "pom.xml", build_pom_xml_content(group_id, artifact_id, spec["name"], variant, version_target)))
+    project_plan["project_path"] = os.path.abspath(os.path.join(output_root, spec["folder"]))
+    project_plan["version_target"] = version_target
+    return project_plan
@@ -0,0 +1,95 @@
+import hashlib
+import json
+import logging
+import os
+
+from larendon.backends import DISK_BACKEND
+from larendon.writer import ProjectWriter, encode_generated_content, merge_io_stats
+
+logger = logging.getLogger(__name__)
+
+# --- Manifest wygenerowanych plików: regeneracja tylko tam, gdzie treść faktycznie się zmieniła ---
+GENERATION_MANIFEST_NAME = ".larendon-manifest"
+GENERATION_MANIFEST_VERSION = 1
+
+def hash_generated_content(content):
+    return hashlib.sha256(encode_generated_content(content)).hexdigest()
+
+def load_generation_manifest(base_path, backend=None):
+    if backend is None:
+        backend = DISK_BACKEND
+    manifest_path = os.path.join(base_path, GENERATION_MANIFEST_NAME)
+    try:
+        data = json.loads(backend.read_bytes(manifest_path).decode("utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable generation manifest '{manifest_path}': {e}")
+        return {}
+    return dict(data.get("files", {})) if isinstance(data, dict) else {}
+
+def serialize_generation_manifest(generation_manifest):
+    return json.dumps({"version": GENERATION_MANIFEST_VERSION, "files": dict(sorted(generation_manifest.items()))}, indent=2) + "\n"
+
+def save_generation_manifest(base_path, generation_manifest, project_writer):
+    manifest_path = os.path.join(base_path, GENERATION_MANIFEST_NAME)
+    serialized = serialize_generation_manifest(generation_manifest)
+    try:
+        if project_writer.backend.read_bytes(manifest_path) == encode_generated_content(serialized):
+            return False
+    except OSError:
+        pass
+    project_writer.stage_file(GENERATION_MANIFEST_NAME, serialized)
+    return True
+
+def new_generation_report():
+    return {"created": [], "updated": [], "unchanged": [], "modified": []}
+
+def write_generated_file(base_path, relative_path, content, generation_manifest, project_writer, generation_report=None, force=False):
+    """Zapisuje plik tylko wtedy, gdy jego treść się zmieniła i nie został ręcznie zmodyfikowany od ostatniej generacji."""
+    relative_path = relative_path.replace(os.sep, "/")
+    file_path = os.path.join(base_path, *relative_path.split("/"))
+    new_hash = hash_generated_content(content)
+    recorded_hash = generation_manifest.get(relative_path)
+
+    try:
+        disk_hash = hashlib.sha256(project_writer.backend.read_bytes(file_path)).hexdigest()
+    except FileNotFoundError:
+        status = "created"
+    else:
+        if disk_hash == new_hash:
+            status = "unchanged"
+        elif disk_hash != recorded_hash and not force:
+            # Plik zmieniony przez użytkownika (albo nieznany manifestowi) - nie nadpisujemy jego pracy
+            status = "modified"
+        else:
+            status = "updated"
+
+    if status in ("created", "updated"):
+        project_writer.stage_file(relative_path, content)
+        generation_manifest[relative_path] = new_hash
+    elif status == "unchanged":
+        generation_manifest[relative_path] = new_hash
+    else:
+        logger.warning(f"File '{file_path}' was modified since it was generated. Left untouched.")
+    if generation_report is not None:
+        generation_report[status].append(relative_path)
+    return status
+
+def adopt_existing_file(base_path, relative_path, generation_manifest, backend, generation_report=None):
+    """Zapisuje w manifeście skrót pliku w obecnej postaci - jego treść staje się wygenerowaną (FileNotFoundError, gdy pliku brak)."""
+    relative_path = relative_path.replace(os.sep, "/")
+    data = backend.read_bytes(os.path.join(base_path, *relative_path.split("/")))
+    generation_manifest[relative_path] = hashlib.sha256(data).hexdigest()
+    if generation_report is not None:
+        generation_report["unchanged"].append(relative_path)
+    return "unchanged"
+
+def write_generated_files(base_path, files, generation_report=None, force=False, fsync_policy="none", io_stats=None):
+    generation_manifest = load_generation_manifest(base_path)
+    with ProjectWriter(base_path, fsync_policy) as project_writer:
+        statuses = {relative_path: write_generated_file(base_path, relative_path, content, generation_manifest, project_writer, generation_report, force) for relative_path, content in files.items()}
+        save_generation_manifest(base_path, generation_manifest, project_writer)
+    if io_stats is not None:
+        merge_io_stats(io_stats, project_writer.stats)
+    return statuses
@@ -0,0 +1,122 @@
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# --- Instrumentacja: spany z monotonicznymi znacznikami czasu i wymiennymi ujściami ---
+class Span:
+    """Jeden pomiar: nazwa, atrybuty, start/koniec (time.monotonic), zapisane bajty i wynik (ok/error/cancelled)."""
+
+    __slots__ = ("name", "attributes", "start", "end", "bytes_written", "outcome", "error")
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = attributes
+        self.start = time.monotonic()
+        self.end = None
+        self.bytes_written = 0
+        self.outcome = None
+        self.error = None
+
+    def to_record(self):
+        return {
+            "name": self.name,
+            "start": self.start,
+            "end": self.end,
+            "duration_ms": round((self.end - self.start) * 1000, 6) if self.end is not None else None,
+            "bytes_written": self.bytes_written,
+            "outcome": self.outcome,
+            "error": self.error,
+            "pid": os.getpid(),
+            "attributes": self.attributes,
+        }
+
+class MemorySink:
+    """Zbiera rekordy spanów w pamięci (np. w testach)."""
+
+    def __init__(self):
+        self.records = []
+        self.lock = threading.Lock()
+
+    def emit(self, record):
+        with self.lock:
+            self.records.append(record)
+
+    def close(self):
+        pass
+
+class JsonLinesSink:
+    """Dopisuje każdy span jako jedną linię JSON; tryb dopisywania pozwala wielu procesom dzielić jeden plik."""
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.file = open(self.path, "a", encoding="utf-8", buffering=1)
+        self.lock = threading.Lock()
+
+    def emit(self, record):
+        line = json.dumps(record, default=str) + "\n"
+        with self.lock:
+            self.file.write(line)
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+class Tracer:
+    def __init__(self):
+        self.sinks = []
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+        return sink
+
+    def remove_sink(self, sink):
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+            sink.close()
+
+    @contextlib.contextmanager
+    def span(self, name, **attributes):
+        span = Span(name, attributes)
+        try:
+            yield span
+        except Exception as e:
+            span.outcome = "error"
+            span.error = str(e)
+            raise
+        except BaseException as e:
+            span.outcome = "cancelled"
+            span.error = type(e).__name__
+            raise
+        else:
+            if span.outcome is None:
+                span.outcome = "ok"
+        finally:
+            span.end = time.monotonic()
+            if self.sinks:
+                record = span.to_record()
+                for sink in self.sinks:
+                    sink.emit(record)
+
+TRACER = Tracer()
+
+def span(name, **attributes):
+    return TRACER.span(name, **attributes)
+
+@contextlib.contextmanager
+def profiled(output_path):
+    """Uruchamia blok pod cProfile i zapisuje statystyki (do odczytu przez pstats/snakeviz) do output_path."""
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(output_path)
+        logger.info(f"cProfile statistics written to {output_path}")
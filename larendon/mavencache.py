@@ -0,0 +1,263 @@
+import logging
+import os
+import re
+import shutil
+
+from larendon.incremental import write_generated_files
+
+logger = logging.getLogger(__name__)
+
+# --- Wstępne wypełnienie lokalnego repozytorium Mavena projektu artefaktami ze współdzielonego cache ---
+PROJECT_MAVEN_REPOSITORY_DIR = ".m2/repository"
+MAVEN_CONFIG_PATH = ".mvn/maven.config"
+MAVEN_CACHE_MODES = ("copy", "link")
+DEFAULT_PLUGIN_GROUP_ID = "org.apache.maven.plugins"
+# Pluginy przypięte do cyklu życia "clean package" dla pakowania jar - ich wersje zna tylko super-POM danej wersji Mavena,
+# więc bierzemy wszystkie wersje obecne w cache
+LIFECYCLE_PLUGIN_ARTIFACT_IDS = ("maven-clean-plugin", "maven-resources-plugin", "maven-compiler-plugin", "maven-surefire-plugin", "maven-jar-plugin")
+ROOT_DEPENDENCY_SCOPES = ("compile", "provided", "runtime", "test")
+TRANSITIVE_DEPENDENCY_SCOPES = ("compile", "runtime")
+POM_PROPERTY_PATTERN = re.compile(r"\$\{([^}]+)\}")
+SKIPPED_CACHE_FILE_SUFFIXES = (".lastUpdated", ".part", ".lock")
+
+def _local_name(element):
+    return element.tag.rsplit("}", 1)[-1]
+
+def _child(element, name):
+    if element is None: return None
+    for child in element:
+        if _local_name(child) == name:
+            return child
+    return None
+
+def _children(element, name):
+    return [child for child in _children_of(element) if _local_name(child) == name]
+
+def _children_of(element):
+    return list(element) if element is not None else []
+
+def _child_text(element, name):
+    child = _child(element, name)
+    return child.text.strip() if child is not None and child.text else None
+
+def parse_pom_model(pom_source):
+    """Wyciąga z pom.xml to, co jest potrzebne do rozwiązania zależności: współrzędne, rodzica, właściwości, zależności i pluginy."""
+    import xml.etree.ElementTree as ElementTree
+
+    root = ElementTree.fromstring(pom_source)
+    parent = _child(root, "parent")
+    parent_coordinate = (_child_text(parent, "groupId"), _child_text(parent, "artifactId"), _child_text(parent, "version")) if parent is not None else None
+
+    def read_dependencies(container):
+        return [{
+            "group_id": _child_text(dependency, "groupId"),
+            "artifact_id": _child_text(dependency, "artifactId"),
+            "version": _child_text(dependency, "version"),
+            "scope": _child_text(dependency, "scope") or "compile",
+            "type": _child_text(dependency, "type") or "jar",
+            "optional": _child_text(dependency, "optional") == "true",
+        } for dependency in _children(_child(container, "dependencies"), "dependency")]
+
+    build = _child(root, "build")
+    plugins = []
+    for plugins_container in (build, _child(build, "pluginManagement")):
+        for plugin in _children(_child(plugins_container, "plugins"), "plugin"):
+            plugins.append({
+                "group_id": _child_text(plugin, "groupId") or DEFAULT_PLUGIN_GROUP_ID,
+                "artifact_id": _child_text(plugin, "artifactId"),
+                "version": _child_text(plugin, "version"),
+                "dependencies": read_dependencies(plugin),
+                "managed": plugins_container is not build,
+            })
+    return {
+        "group_id": _child_text(root, "groupId") or (parent_coordinate[0] if parent_coordinate else None),
+        "artifact_id": _child_text(root, "artifactId"),
+        "version": _child_text(root, "version") or (parent_coordinate[2] if parent_coordinate else None),
+        "parent": parent_coordinate,
+        "properties": {_local_name(prop): (prop.text or "").strip() for prop in _children_of(_child(root, "properties"))},
+        "dependencies": read_dependencies(root),
+        "managed_dependencies": read_dependencies(_child(root, "dependencyManagement")),
+        "plugins": plugins,
+    }
+
+class MavenCachePrewarmer:
+    """Przechodzi domknięcie artefaktów potrzebnych do "mvn package" (rodzice, BOM-y, zależności compile/runtime, pluginy)
+    na podstawie pomów z cache i kopiuje (albo linkuje) ich katalogi wersji do repozytorium projektu."""
+
+    def __init__(self, cache_repository_path, project_repository_path, mode="copy"):
+        if mode not in MAVEN_CACHE_MODES:
+            raise ValueError(f"Unknown Maven cache mode '{mode}'. Use one of: {', '.join(MAVEN_CACHE_MODES)}.")
+        self.cache_repository_path = os.path.abspath(cache_repository_path)
+        self.project_repository_path = os.path.abspath(project_repository_path)
+        self.mode = mode
+        self.visited = set()
+        self.effective_models = {}
+        self.report = {"hits": [], "misses": [], "files_copied": 0, "files_linked": 0, "bytes_copied": 0}
+
+    def version_directory(self, repository_path, coordinate):
+        group_id, artifact_id, version = coordinate
+        return os.path.join(repository_path, *group_id.split("."), artifact_id, version)
+
+    def cached_versions(self, group_id, artifact_id):
+        try:
+            return sorted(entry.name for entry in os.scandir(os.path.join(self.cache_repository_path, *group_id.split("."), artifact_id)) if entry.is_dir())
+        except OSError:
+            return []
+
+    def read_cached_model(self, coordinate):
+        pom_path = os.path.join(self.version_directory(self.cache_repository_path, coordinate), f"{coordinate[1]}-{coordinate[2]}.pom")
+        try:
+            with open(pom_path, "rb") as f:
+                return parse_pom_model(f.read())
+        except (OSError, SyntaxError) as e:
+            logger.warning(f"Cannot read cached pom '{pom_path}': {e}")
+            return None
+
+    def effective_model(self, coordinate, model=None):
+        # Właściwości i wersje zarządzane dziedziczone po rodzicach (dziecko nadpisuje rodzica) oraz z importowanych BOM-ów
+        if coordinate in self.effective_models:
+            return self.effective_models[coordinate]
+        model = model or self.read_cached_model(coordinate)
+        if model is None:
+            return None
+        self.effective_models[coordinate] = model
+        properties = {}
+        managed_versions = {}
+        if model["parent"] and all(model["parent"]):
+            parent_model = self.effective_model(model["parent"])
+            if parent_model is not None:
+                # .get - rodzic w trakcie budowy oznacza cykl w łańcuchu rodziców
+                properties.update(parent_model.get("effective_properties", {}))
+                managed_versions.update(parent_model.get("managed_versions", {}))
+        properties.update(model["properties"])
+        properties.update({"project.groupId": model["group_id"], "project.artifactId": model["artifact_id"], "project.version": model["version"], "pom.version": model["version"]})
+        if model["parent"]:
+            properties["project.parent.version"] = model["parent"][2]
+        model["effective_properties"] = properties
+        for managed in model["managed_dependencies"]:
+            group_id, artifact_id, version = (self.interpolate(managed[key], properties) for key in ("group_id", "artifact_id", "version"))
+            if managed["scope"] == "import" and managed["type"] == "pom" and version:
+                bom_model = self.effective_model((group_id, artifact_id, version))
+                if bom_model is not None:
+                    for key, value in bom_model.get("managed_versions", {}).items():
+                        managed_versions.setdefault(key, value)
+            elif version:
+                managed_versions[(group_id, artifact_id)] = version
+        model["managed_versions"] = managed_versions
+        return model
+
+    def interpolate(self, value, properties, depth=0):
+        if not value or "${" not in value or depth > 8:
+            return value
+        return self.interpolate(POM_PROPERTY_PATTERN.sub(lambda match: properties.get(match.group(1), match.group(0)), value), properties, depth + 1)
+
+    def resolved_dependencies(self, model, scopes):
+        properties = model["effective_properties"]
+        for dependency in model["dependencies"]:
+            if dependency["optional"] or dependency["scope"] not in scopes: continue
+            group_id = self.interpolate(dependency["group_id"], properties)
+            artifact_id = self.interpolate(dependency["artifact_id"], properties)
+            version = self.interpolate(dependency["version"], properties) or model["managed_versions"].get((group_id, artifact_id))
+            yield group_id, artifact_id, version
+
+    def add_artifact(self, coordinate):
+        group_id, artifact_id, version = coordinate
+        if not version or "${" in version or version[:1] in "[(":
+            # Zakresy wersji i nierozwiązane właściwości wymagałyby metadanych z sieci
+            self.report["misses"].append(f"{group_id}:{artifact_id}:{version or '?'}")
+            return
+        if coordinate in self.visited:
+            return
+        self.visited.add(coordinate)
+        source_directory = self.version_directory(self.cache_repository_path, coordinate)
+        if not os.path.isdir(source_directory):
+            self.report["misses"].append(f"{group_id}:{artifact_id}:{version}")
+            return
+        self.report["hits"].append(f"{group_id}:{artifact_id}:{version}")
+        self.copy_version_directory(source_directory, self.version_directory(self.project_repository_path, coordinate))
+
+        model = self.effective_model(coordinate)
+        if model is None:
+            return
+        if model["parent"] and all(model["parent"]):
+            self.add_artifact(model["parent"])
+        for managed in model["managed_dependencies"]:
+            if managed["scope"] == "import":
+                self.add_artifact(tuple(self.interpolate(managed[key], model["effective_properties"]) for key in ("group_id", "artifact_id", "version")))
+        for dependency_coordinate in self.resolved_dependencies(model, TRANSITIVE_DEPENDENCY_SCOPES):
+            self.add_artifact(dependency_coordinate)
+
+    def copy_version_directory(self, source_directory, target_directory):
+        os.makedirs(target_directory, exist_ok=True)
+        for entry in os.scandir(source_directory):
+            if not entry.is_file() or entry.name.endswith(SKIPPED_CACHE_FILE_SUFFIXES): continue
+            target_path = os.path.join(target_directory, entry.name)
+            source_size = entry.stat().st_size
+            if os.path.isfile(target_path) and os.path.getsize(target_path) == source_size:
+                continue
+            if self.mode == "link":
+                try:
+                    os.link(entry.path, target_path)
+                    self.report["files_linked"] += 1
+                    continue
+                except OSError:
+                    pass  # Inny system plików albo brak uprawnień - kopiujemy
+            shutil.copyfile(entry.path, target_path)
+            self.report["files_copied"] += 1
+            self.report["bytes_copied"] += source_size
+
+    def prewarm_from_pom(self, pom_source):
+        model = self.effective_model(("", "", ""), parse_pom_model(pom_source))
+        if model["parent"] and all(model["parent"]):
+            self.add_artifact(model["parent"])
+        for dependency_coordinate in self.resolved_dependencies(model, ROOT_DEPENDENCY_SCOPES):
+            self.add_artifact(dependency_coordinate)
+        declared_plugins = set()
+        properties = model["effective_properties"]
+        for plugin in model["plugins"]:
+            group_id = self.interpolate(plugin["group_id"], properties)
+            artifact_id = self.interpolate(plugin["artifact_id"], properties)
+            declared_plugins.add((group_id, artifact_id))
+            if plugin["managed"] and not plugin["version"]: continue
+            self.add_artifact((group_id, artifact_id, self.interpolate(plugin["version"], properties)))
+            for dependency in plugin["dependencies"]:
+                self.add_artifact(tuple(self.interpolate(dependency[key], properties) for key in ("group_id", "artifact_id", "version")))
+        for artifact_id in LIFECYCLE_PLUGIN_ARTIFACT_IDS:
+            if (DEFAULT_PLUGIN_GROUP_ID, artifact_id) in declared_plugins: continue
+            for version in self.cached_versions(DEFAULT_PLUGIN_GROUP_ID, artifact_id):
+                self.add_artifact((DEFAULT_PLUGIN_GROUP_ID, artifact_id, version))
+        self.report["misses"] = sorted(set(self.report["misses"]))
+        return self.report
+
+def new_maven_cache_stats():
+    return {"hits": 0, "misses": 0, "files_copied": 0, "files_linked": 0, "bytes_copied": 0, "missing": []}
+
+def merge_maven_cache_stats(total_stats, stats):
+    for key in ("hits", "misses", "files_copied", "files_linked", "bytes_copied"):
+        total_stats[key] += stats.get(key, 0)
+    total_stats["missing"] = sorted(set(total_stats["missing"]).union(stats.get("missing", ())))
+    return total_stats
+
+def maven_cache_stats_from_report(report):
+    stats = new_maven_cache_stats()
+    stats.update(hits=len(report["hits"]), misses=len(report["misses"]), files_copied=report["files_copied"], files_linked=report["files_linked"], bytes_copied=report["bytes_copied"], missing=list(report["misses"]))
+    return stats
+
+# --- Etap po wygenerowaniu projektu: repozytorium projektu + .mvn/maven.config wskazujący na nie ---
+def prewarm_project_maven_cache(project_path, cache_repository_path, mode="copy", fsync_policy="none"):
+    project_path = os.path.abspath(project_path)
+    if not os.path.isdir(cache_repository_path):
+        raise ValueError(f"Maven cache directory '{cache_repository_path}' does not exist.")
+    with open(os.path.join(project_path, "pom.xml"), "rb") as f:
+        pom_source = f.read()
+    prewarmer = MavenCachePrewarmer(cache_repository_path, os.path.join(project_path, *PROJECT_MAVEN_REPOSITORY_DIR.split("/")), mode)
+    try:
+        report = prewarmer.prewarm_from_pom(pom_source)
+    except SyntaxError as e:
+        raise ValueError(f"Cannot parse pom.xml of '{project_path}': {e}") from None
+    # Maven 3.3.1+ czyta .mvn/maven.config; ścieżka względna - mvn uruchamiany z katalogu projektu
+    write_generated_files(project_path, {MAVEN_CONFIG_PATH: f"-Dmaven.repo.local={PROJECT_MAVEN_REPOSITORY_DIR}\n"}, fsync_policy=fsync_policy)
+    logger.info(f"Maven cache pre-warmed for '{project_path}': {len(report['hits'])} hit(s), {len(report['misses'])} miss(es), {report['files_copied']} file(s) copied, {report['files_linked']} linked")
+    for missing_coordinate in report["misses"]:
+        logger.warning(f"Maven cache miss for '{project_path}': {missing_coordinate}")
+    return report
@@ -0,0 +1,66 @@
+import re
+
+# --- Wzorce identyfikatorów kompilowane raz, przy imporcie modułu ---
+CLASS_NAME_SEPARATOR_PATTERN = re.compile(r'[^a-zA-Z0-9_]+')
+GROUP_ID_INVALID_CHARS_PATTERN = re.compile(r'[^a-z0-9_.-]')
+ARTIFACT_ID_INVALID_CHARS_PATTERN = re.compile(r'[^a-zA-Z0-9_.-]')
+PACKAGE_SEGMENT_INVALID_CHARS_PATTERN = re.compile(r'[^a-z0-9_]')
+
+# --- Słowa zastrzeżone Javy (słowa kluczowe, literały i "_") - nie mogą być nazwą pakietu ani klasy ---
+JAVA_RESERVED_WORDS = frozenset((
+    "abstract", "assert", "boolean", "break", "byte", "case", "catch", "char", "class", "const",
+    "continue", "default", "do", "double", "else", "enum", "extends", "final", "finally", "float",
+    "for", "goto", "if", "implements", "import", "instanceof", "int", "interface", "long", "native",
+    "new", "package", "private", "protected", "public", "return", "short", "static", "strictfp", "super",
+    "switch", "synchronized", "this", "throw", "throws", "transient", "try", "void", "volatile", "while",
+    "true", "false", "null", "_",
+))
+
+def to_java_identifier(name):
+    # Konwencja z JLS (6.1): słowo zastrzeżone dostaje "_" na końcu, nazwa zaczynająca się cyfrą - "_" na początku
+    if name in JAVA_RESERVED_WORDS:
+        return f"{name}_"
+    if name[:1].isdigit():
+        return f"_{name}"
+    return name
+
+# --- Funkcja pomocnicza do konwersji na CamelCase ---
+def to_camel_case_for_class(text):
+    if not text: return "MyPlugin"
+    s = CLASS_NAME_SEPARATOR_PATTERN.sub(' ', text)
+    parts = s.split()
+    if not parts: return "MyPlugin"
+    return to_java_identifier("".join(p[0].upper() + p[1:].lower() if len(p)>1 else p.upper() for p in parts))
+
+# --- Funkcje pomocnicze do sanityzacji groupId i artifactId ---
+def sanitize_group_id(author_name):
+    sanitized_author = GROUP_ID_INVALID_CHARS_PATTERN.sub('', author_name.lower().replace(" ", "."))
+    if not sanitized_author: sanitized_author = "default.author"
+    return f"pl.{sanitized_author}"
+
+def sanitize_artifact_id(plugin_artifact_id):
+    processed_artifact_id = ARTIFACT_ID_INVALID_CHARS_PATTERN.sub('', plugin_artifact_id.replace(" ", "-"))
+    if not processed_artifact_id: processed_artifact_id = "myplugin"
+    return processed_artifact_id
+
+# --- Pakiet Javy wyprowadzony z groupId i artifactId ---
+def java_package_segments(group_id, artifact_id):
+    """Segmenty pakietu głównej klasy; groupId może zawierać "-" i puste człony, które w Javie są niedozwolone."""
+    segments = [to_java_identifier(segment.replace("-", "_")) for segment in group_id.split(".") if segment.strip("-")]
+    artifact_package_name = PACKAGE_SEGMENT_INVALID_CHARS_PATTERN.sub('', artifact_id.lower())
+    if not artifact_package_name: artifact_package_name = "plugin"
+    segments.append(to_java_identifier(artifact_package_name))
+    return segments
+
+def project_identifiers(author_name, plugin_artifact_id):
+    group_id = sanitize_group_id(author_name)
+    artifact_id = sanitize_artifact_id(plugin_artifact_id)
+    package_segments = java_package_segments(group_id, artifact_id)
+    main_class_name = to_camel_case_for_class(artifact_id)
+    return {
+        "group_id": group_id,
+        "artifact_id": artifact_id,
+        "package_name": ".".join(package_segments),
+        "main_class_name": main_class_name,
+        "main_class": ".".join(package_segments + [main_class_name]),
+    }
@@ -0,0 +1,47 @@
+import asyncio
+import logging
+import os
+
+from larendon.backends import DISK_BACKEND
+from larendon.generator import check_backend_options, prewarm_published_project, stage_and_publish_project
+from larendon.instrumentation import span
+from larendon.mavencache import maven_cache_stats_from_report
+from larendon.taskgraph import TASK_GRAPH_WORKERS
+from larendon.validation import validate_plugin_spec, validate_plugin_specs
+
+logger = logging.getLogger(__name__)
+
+# --- Asynchroniczny potok generowania: ta sama ścieżka co generate(), tylko jej blokujące kroki idą do wątków ---
+async def generate_project(spec, output_root=".", default_variant=None, force=False, fsync_policy="none", maven_cache=None, maven_cache_mode="copy", skeleton_mode="clone", backend=None):
+    """Generuje jeden projekt bez blokowania pętli zdarzeń - przygotowanie, publikacja i rozgrzewanie cache Mavena działają w wątkach (asyncio.to_thread)."""
+    if backend is None:
+        backend = DISK_BACKEND
+    check_backend_options(backend, maven_cache)
+    with span("validate"):
+        spec = validate_plugin_spec(spec)
+    project_path = os.path.abspath(os.path.join(output_root, spec["folder"]))
+    with span("project", project=project_path) as project_span:
+        project_writer = backend.open_project_writer(project_path, fsync_policy)
+        try:
+            generation_report = await asyncio.to_thread(stage_and_publish_project, spec, project_writer, default_variant, force, TASK_GRAPH_WORKERS, skeleton_mode)
+        except asyncio.CancelledError:
+            # Wątek pracuje dalej - zamknięty writer odrzuca jego kolejne zapisy, więc z anulowanego projektu nic nie zostaje opublikowane
+            project_writer.abort()
+            raise
+        project_span.bytes_written = project_writer.stats["bytes_written"]
+    logger.info(f"Project '{project_path}' generated.")
+    project_result = {"folder": spec["folder"], "project_path": project_path, "files": generation_report, "io": project_writer.stats}
+    if maven_cache:
+        maven_cache_report = await asyncio.to_thread(prewarm_published_project, project_path, maven_cache, maven_cache_mode, fsync_policy)
+        project_result["maven_cache"] = maven_cache_stats_from_report(maven_cache_report)
+    return project_result
+
+async def generate_projects(specs, output_root=".", concurrency=8, default_variant=None, force=False, fsync_policy="none", maven_cache=None, maven_cache_mode="copy", skeleton_mode="clone", backend=None):
+    specs = validate_plugin_specs(specs)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def generate_with_limit(spec):
+        async with semaphore:
+            return await generate_project(spec, output_root, default_variant, force, fsync_policy, maven_cache, maven_cache_mode, skeleton_mode, backend)
+
+    return await asyncio.gather(*(generate_with_limit(spec) for spec in specs), return_exceptions=True)
@@ -0,0 +1,99 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# --- Domyślna maksymalna częstotliwość odświeżania linii postępu (klatek na sekundę) ---
+PROGRESS_REFRESH_HZ = 10
+
+# --- Funkcja formatująca pozostały czas (ETA) ---
+def format_eta(seconds):
+    if seconds is None: return "--:--"
+    seconds = int(seconds + 0.5)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+# --- Postęp: liczniki aktualizowane przez zadania, rysowane przez osobny wątek z ograniczoną częstotliwością ---
+class ProgressTracker:
+    """Zadania tylko zwiększają liczniki (O(1), bez pisania na terminal); wątek w tle co 1/refresh_hz sekundy
+    wywołuje draw(snapshot, final) - koszt wyświetlania nie zależy od liczby zadań."""
+
+    def __init__(self, total_count, draw, refresh_hz=PROGRESS_REFRESH_HZ):
+        self.total_count = total_count
+        self.draw = draw
+        self.refresh_interval = 1.0 / refresh_hz if refresh_hz > 0 else None
+        self.done_count = 0
+        self.failed_count = 0
+        self.last_description = ""
+        self.started_at = None
+        self.frame = 0
+        # Blokada chroniąca także wyjście terminala - inne komunikaty (np. błędy) wypisujemy pod nią
+        self.lock = threading.RLock()
+        self.stopped = threading.Event()
+        self.ticker_thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self.redraw()
+        if self.refresh_interval is not None:
+            self.ticker_thread = threading.Thread(target=self.run_ticker, name="larendon-progress", daemon=True)
+            self.ticker_thread.start()
+        return self
+
+    def advance(self, description="", count=1, failed_count=0):
+        with self.lock:
+            self.done_count += count
+            self.failed_count += failed_count
+            if description: self.last_description = description
+
+    def update(self, done_count, description="", total_count=None):
+        with self.lock:
+            self.done_count = done_count
+            if description: self.last_description = description
+            if total_count is not None: self.total_count = total_count
+
+    def snapshot(self):
+        elapsed_sec = time.perf_counter() - self.started_at if self.started_at is not None else 0.0
+        rate = self.done_count / elapsed_sec if elapsed_sec > 0 else 0.0
+        remaining_count = max(0, self.total_count - self.done_count)
+        eta_sec = remaining_count / rate if rate > 0 else (0.0 if remaining_count == 0 else None)
+        return {
+            "done": self.done_count,
+            "total": self.total_count,
+            "failed": self.failed_count,
+            "percent": int(self.done_count * 100 / self.total_count) if self.total_count else 100,
+            "description": self.last_description,
+            "elapsed_sec": elapsed_sec,
+            "rate": rate,
+            "eta_sec": eta_sec,
+            "frame": self.frame,
+        }
+
+    def redraw(self, final=False):
+        with self.lock:
+            self.frame += 1
+            try:
+                self.draw(self.snapshot(), final)
+            except Exception as e:
+                # Wyświetlanie postępu nigdy nie może przerwać generowania
+                logger.debug(f"Progress draw failed: {e}")
+
+    def run_ticker(self):
+        while not self.stopped.wait(self.refresh_interval):
+            self.redraw()
+
+    def stop(self):
+        if self.stopped.is_set(): return
+        self.stopped.set()
+        if self.ticker_thread is not None:
+            self.ticker_thread.join()
+        self.redraw(final=True)
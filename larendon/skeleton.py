@@ -0,0 +1,103 @@
+import functools
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+from larendon.backends import DISK_BACKEND
+from larendon.templating import TEMPLATE_REGISTRY
+from larendon.writer import encode_generated_content
+
+logger = logging.getLogger(__name__)
+
+# --- Szkielet projektu: niezmienne pliki i foldery wariantu, przygotowane raz i klonowane do każdego nowego projektu ---
+SKELETON_MODES = ("clone", "hardlink", "off")
+SKELETON_CACHE_ENV_VAR = "LARENDON_CACHE_DIR"
+
+def default_skeleton_cache_root():
+    cache_root = os.environ.get(SKELETON_CACHE_ENV_VAR) or os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "larendon")
+    return os.path.join(cache_root, "skeletons")
+
+def read_skeleton_file(source_path):
+    with open(source_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+class Skeleton:
+    """Zmaterializowany szkielet w cache: katalog, lista plików i folderów oraz skróty treści do manifestu generacji."""
+
+    __slots__ = ("path", "files", "directories", "hashes", "sizes")
+
+    def __init__(self, path, files, directories, hashes, sizes):
+        self.path = path
+        self.files = files
+        self.directories = directories
+        self.hashes = hashes
+        self.sizes = sizes
+
+@functools.lru_cache(maxsize=32)
+def materialize_skeleton(source_files, directories, cache_root):
+    # source_files: ((ścieżka względna, plik źródłowy, mtime_ns), ...) - zmiana pliku źródłowego daje nowy klucz cache
+    contents = {relative_path: encode_generated_content(read_skeleton_file(source_path)) for relative_path, source_path, _ in source_files}
+    hashes = {relative_path: hashlib.sha256(data).hexdigest() for relative_path, data in contents.items()}
+    # Nazwa katalogu wynika z treści, więc różne procesy i wersje szablonów nigdy nie współdzielą niezgodnego szkieletu
+    skeleton_key = hashlib.sha256(json.dumps([sorted(hashes.items()), list(directories), os.linesep]).encode("utf-8")).hexdigest()[:24]
+    skeleton_path = os.path.join(cache_root, skeleton_key)
+    if not os.path.isdir(skeleton_path):
+        os.makedirs(cache_root, exist_ok=True)
+        building_path = tempfile.mkdtemp(prefix=".build-", dir=cache_root)
+        try:
+            for relative_dir in directories:
+                os.makedirs(os.path.join(building_path, *relative_dir.split("/")), exist_ok=True)
+            for relative_path, data in contents.items():
+                file_path = os.path.join(building_path, *relative_path.split("/"))
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with open(file_path, "wb") as f:
+                    f.write(data)
+            os.rename(building_path, skeleton_path)
+            logger.info(f"Skeleton cache built at '{skeleton_path}' ({len(contents)} file(s), {len(directories)} folder(s))")
+        except OSError:
+            shutil.rmtree(building_path, ignore_errors=True)
+            # Inny proces zbudował ten sam szkielet w międzyczasie - jego wynik jest identyczny
+            if not os.path.isdir(skeleton_path):
+                raise
+    return Skeleton(skeleton_path, tuple(contents), directories, hashes, {relative_path: len(data) for relative_path, data in contents.items()})
+
+def prepare_skeleton(variant=None, invariant_directories=(), cache_root=None):
+    source_files = tuple((relative_path, source_path, os.stat(source_path).st_mtime_ns) for relative_path, source_path in TEMPLATE_REGISTRY.resolve_skeleton(variant).items())
+    return materialize_skeleton(source_files, tuple(sorted(invariant_directories)), os.path.abspath(cache_root or default_skeleton_cache_root()))
+
+def skeleton_file_contents(variant=None):
+    return {relative_path: read_skeleton_file(source_path) for relative_path, source_path in TEMPLATE_REGISTRY.resolve_skeleton(variant).items()}
+
+def select_skeleton(base_path, variant=None, invariant_directories=(), skeleton_mode="clone", backend=None):
+    """Szkielet do sklonowania albo None - wtedy pliki szkieletu zapisujemy pojedynczo (istniejący projekt, tryb "off", niedostępny cache, backend bez dysku)."""
+    if skeleton_mode not in SKELETON_MODES:
+        raise ValueError(f"Unknown skeleton mode '{skeleton_mode}'. Use one of: {', '.join(SKELETON_MODES)}.")
+    if backend is None:
+        backend = DISK_BACKEND
+    # W istniejącym projekcie klon nadpisałby zmiany użytkownika - tam działa ścieżka przyrostowa z manifestem
+    if skeleton_mode == "off" or not backend.supports_clone or not is_fresh_project(base_path, backend):
+        return None
+    try:
+        return prepare_skeleton(variant, invariant_directories)
+    except OSError as e:
+        logger.warning(f"Skeleton cache unavailable ({e}); writing invariant files one by one.")
+        return None
+
+def is_fresh_project(base_path, backend=None):
+    try:
+        return not (backend or DISK_BACKEND).list_dir(base_path)
+    except FileNotFoundError:
+        return True
+
+def clone_skeleton_into(project_writer, skeleton, generation_manifest, generation_report=None, use_hardlink=False):
+    """Nowy projekt: cały szkielet trafia do katalogu tymczasowego writera bez renderowania i bez zapisu treści przez proces."""
+    clone_methods = project_writer.clone_tree(skeleton.path, skeleton.files, skeleton.directories, use_hardlink, skeleton.sizes)
+    for relative_path in skeleton.files:
+        generation_manifest[relative_path] = skeleton.hashes[relative_path]
+        if generation_report is not None:
+            generation_report["created"].append(relative_path)
+    logger.info(f"Skeleton cloned into '{project_writer.base_path}': {', '.join(f'{count} by {method}' for method, count in clone_methods.items()) or 'folders only'}")
+    return clone_methods
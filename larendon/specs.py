@@ -0,0 +1,101 @@
+import json
+import logging
+import os
+
+from larendon.incremental import adopt_existing_file, write_generated_file
+from larendon.naming import sanitize_artifact_id
+
+logger = logging.getLogger(__name__)
+
+# --- Tryb wsadowy: wczytywanie manifestu z wieloma specyfikacjami pluginów ---
+MANIFEST_SPEC_KEYS = {
+    "folder": "folder",
+    "name": "name",
+    "display_name": "name",
+    "author": "author",
+    "artifact_id": "artifact_id",
+    "artifactId": "artifact_id",
+    "plugin_name": "artifact_id",
+    "variant": "variant",
+    "minecraft_version": "minecraft_version",
+    "mc_version": "minecraft_version",
+    "server": "server",
+}
+
+def normalize_manifest_row(row):
+    spec = {}
+    for key, value in row.items():
+        canonical_key = MANIFEST_SPEC_KEYS.get(key.strip() if isinstance(key, str) else key)
+        if canonical_key and value is not None:
+            spec[canonical_key] = str(value).strip()
+    missing = [k for k in ("name", "author", "artifact_id") if not spec.get(k)]
+    if missing:
+        raise ValueError(f"Missing required field(s): {', '.join(missing)}")
+    if not spec.get("folder"):
+        spec["folder"] = sanitize_artifact_id(spec["artifact_id"])
+    return spec
+
+# --- Plik specyfikacji w folderze projektu: źródło metadanych dla trybu obserwowania (watch) ---
+PROJECT_SPEC_FILE_NAME = "larendon.json"
+PROJECT_SPEC_KEYS = ("name", "author", "artifact_id", "variant", "minecraft_version", "server")
+
+def serialize_project_spec(spec):
+    return json.dumps({key: spec[key] for key in PROJECT_SPEC_KEYS if spec.get(key)}, indent=2) + "\n"
+
+def load_project_spec(project_path):
+    """Specyfikacja projektu z jego pliku larendon.json; folder to zawsze nazwa folderu projektu."""
+    spec_path = os.path.join(project_path, PROJECT_SPEC_FILE_NAME)
+    with open(spec_path, "r", encoding="utf-8") as f:
+        try:
+            row = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Project spec '{spec_path}' is not valid JSON: {e}") from None
+    if not isinstance(row, dict):
+        raise ValueError(f"Project spec '{spec_path}' must be a JSON object.")
+    return normalize_manifest_row(dict(row, folder=os.path.basename(os.path.abspath(project_path))))
+
+def stage_project_spec_file(project_writer, project_path, spec, generation_manifest, generation_report=None, force=False, adopt_existing=False):
+    """larendon.json jest śledzony w manifeście generacji jak pozostałe pliki: nowe odpowiedzi (interaktywnie, wsadowo) go nadpisują,
+    a plik edytowany przez użytkownika zostaje na miejscu ze statusem "modified".
+
+    adopt_existing (tryb watch): specyfikacja pochodzi z tego pliku, więc jego obecna treść staje się punktem odniesienia - bez przepisywania.
+    """
+    if adopt_existing:
+        try:
+            return adopt_existing_file(project_path, PROJECT_SPEC_FILE_NAME, generation_manifest, project_writer.backend, generation_report)
+        except FileNotFoundError:
+            pass
+    return write_generated_file(project_path, PROJECT_SPEC_FILE_NAME, serialize_project_spec(spec), generation_manifest, project_writer, generation_report, force)
+
+def load_plugin_specs_manifest(manifest_path):
+    extension = os.path.splitext(manifest_path)[1].lower()
+    if extension == ".json":
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        rows = data.get("plugins", []) if isinstance(data, dict) else data
+    elif extension == ".toml":
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError("TOML manifests require Python 3.11 or newer.")
+        with open(manifest_path, "rb") as f:
+            rows = tomllib.load(f).get("plugins", [])
+    elif extension == ".csv":
+        import csv
+        with open(manifest_path, "r", encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+    else:
+        raise ValueError(f"Unsupported manifest format '{extension}'. Use .json, .toml or .csv.")
+    if not isinstance(rows, list):
+        raise ValueError("Manifest must contain a list of plugin specs.")
+    logger.info(f"Loaded {len(rows)} plugin spec(s) from manifest '{manifest_path}'")
+    return rows
+
+def apply_spec_defaults(rows, spec_defaults):
+    """Uzupełnia wiersze wartościami domyślnymi (np. --minecraft-version); wiersz nadpisuje je tylko niepustą wartością."""
+    spec_defaults = {key: value for key, value in (spec_defaults or {}).items() if value}
+    if not spec_defaults:
+        return rows
+    # Puste pole CSV ("") albo null znaczy "nie podano" - inaczej normalize_manifest_row zgubiłby wartość domyślną.
+    # Rozpakowanie zamiast dict(..., **row): csv.DictReader zapisuje nadmiarowe pola wiersza pod kluczem None
+    return [{**spec_defaults, **{key: value for key, value in row.items() if value is not None and str(value).strip()}} if isinstance(row, dict) else row for row in rows]
@@ -0,0 +1,123 @@
+import concurrent.futures
+import logging
+
+logger = logging.getLogger(__name__)
+
+# --- Domyślna liczba wątków wykonujących niezależne zadania generowania ---
+TASK_GRAPH_WORKERS = 4
+
+# --- Graf zadań: każde zadanie deklaruje zależności, niezależne zadania wykonują się równolegle ---
+class GraphTask:
+    """Jedno zadanie grafu; po wykonaniu outcome to "ok", "error" albo "skipped" (nie wykonane, bo zawiodła jego zależność)."""
+
+    __slots__ = ("name", "description", "action", "dependencies", "outcome", "error", "result")
+
+    def __init__(self, name, description, action, dependencies):
+        self.name = name
+        self.description = description
+        self.action = action
+        self.dependencies = tuple(dependencies)
+        self.outcome = None
+        self.error = None
+        self.result = None
+
+class TaskGraph:
+    def __init__(self):
+        self.tasks = {}
+
+    def add(self, name, description, action, depends_on=()):
+        if name in self.tasks:
+            raise ValueError(f"Task '{name}' is already defined.")
+        if not callable(action):
+            raise TypeError(f"Task action for '{description}' is not correctly defined.")
+        self.tasks[name] = GraphTask(name, description, action, depends_on)
+        return self.tasks[name]
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def _dependents_by_task(self):
+        dependents = {name: [] for name in self.tasks}
+        for task in self.tasks.values():
+            for dependency_name in task.dependencies:
+                if dependency_name not in self.tasks:
+                    raise ValueError(f"Task '{task.name}' depends on unknown task '{dependency_name}'.")
+                dependents[dependency_name].append(task.name)
+        return dependents
+
+    def validate(self):
+        # Algorytm Kahna: jeśli nie da się uporządkować wszystkich zadań, w grafie jest cykl
+        dependents = self._dependents_by_task()
+        pending_counts = {name: len(task.dependencies) for name, task in self.tasks.items()}
+        ready = [name for name, count in pending_counts.items() if count == 0]
+        ordered_count = 0
+        while ready:
+            name = ready.pop()
+            ordered_count += 1
+            for dependent_name in dependents[name]:
+                pending_counts[dependent_name] -= 1
+                if pending_counts[dependent_name] == 0:
+                    ready.append(dependent_name)
+        if ordered_count != len(self.tasks):
+            cyclic_names = sorted(name for name, count in pending_counts.items() if count > 0)
+            raise ValueError(f"Task graph contains a dependency cycle between: {', '.join(cyclic_names)}.")
+        return dependents
+
+    def run(self, max_workers=TASK_GRAPH_WORKERS, on_task_done=None):
+        """Wykonuje graf; błąd zadania pomija tylko zadania od niego zależne (pośrednio lub bezpośrednio).
+        on_task_done(task) jest wywoływane w wątku wywołującym, w kolejności kończenia się zadań."""
+        dependents = self.validate()
+        pending_counts = {name: len(task.dependencies) for name, task in self.tasks.items()}
+        ready = [name for name, count in pending_counts.items() if count == 0]
+
+        def finish(task):
+            if task.outcome == "ok":
+                for dependent_name in dependents[task.name]:
+                    pending_counts[dependent_name] -= 1
+                    if pending_counts[dependent_name] == 0:
+                        ready.append(dependent_name)
+            else:
+                skip_dependents(task)
+            if on_task_done is not None:
+                on_task_done(task)
+
+        def skip_dependents(failed_task):
+            for dependent_name in dependents[failed_task.name]:
+                dependent_task = self.tasks[dependent_name]
+                if dependent_task.outcome is not None: continue
+                dependent_task.outcome = "skipped"
+                dependent_task.error = f"dependency '{failed_task.description}' failed"
+                logger.warning(f"Task '{dependent_task.description}' skipped: {dependent_task.error}")
+                finish(dependent_task)
+
+        def execute(task):
+            try:
+                task.result = task.action()
+                task.outcome = "ok"
+            except Exception as e:
+                task.outcome = "error"
+                task.error = e
+
+        if max_workers is None or max_workers <= 1 or len(self.tasks) <= 1:
+            # Bez puli wątków: kolejność wykonania jest deterministyczna (kolejność dodania zadań gotowych do startu)
+            while ready:
+                task = self.tasks[ready.pop(0)]
+                execute(task)
+                finish(task)
+            return list(self.tasks.values())
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(self.tasks)), thread_name_prefix="larendon-task") as pool:
+            running = {}
+            try:
+                while ready or running:
+                    while ready:
+                        task = self.tasks[ready.pop(0)]
+                        running[pool.submit(execute, task)] = task
+                    done_futures, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done_futures:
+                        finish(running.pop(future))
+            except BaseException:
+                # Np. Ctrl-C: zadania jeszcze nieuruchomione nie startują, trwające kończą się przed wyjściem
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+        return list(self.tasks.values())
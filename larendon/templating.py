@@ -0,0 +1,86 @@
+import functools
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# --- Rejestr szablonów: kompilacja raz, renderowanie przez samo podstawianie zmiennych ---
+TEMPLATE_PLACEHOLDER_PATTERN = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+TEMPLATE_FILE_SUFFIX = ".tmpl"
+SKELETON_DIR_NAME = "skeleton"
+BUILTIN_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+class TemplateError(ValueError):
+    pass
+
+@functools.lru_cache(maxsize=128)
+def compile_template_file(template_path, template_mtime_ns):
+    # mtime jest częścią klucza cache - zmieniony plik szablonu zostanie skompilowany ponownie
+    with open(template_path, "r", encoding="utf-8") as f:
+        source = f.read()
+    segments = []
+    last_end = 0
+    for match in TEMPLATE_PLACEHOLDER_PATTERN.finditer(source):
+        segments.append((source[last_end:match.start()], match.group(1)))
+        last_end = match.end()
+    trailing_literal = source[last_end:]
+    logger.info(f"Compiled template '{template_path}' ({len(segments)} placeholder(s))")
+    return tuple(segments), trailing_literal
+
+class TemplateRegistry:
+    """Wyszukuje szablony (także wariantowe, np. paper/pom.xml) i renderuje je z cache'owanej, skompilowanej postaci."""
+
+    def __init__(self, builtin_directory=BUILTIN_TEMPLATE_DIR):
+        self.template_directories = [builtin_directory]
+        self.registered_templates = {}
+
+    def register_directory(self, directory):
+        # Katalogi zarejestrowane później mają pierwszeństwo przed wbudowanymi szablonami
+        directory = os.path.abspath(directory)
+        if directory not in self.template_directories:
+            self.template_directories.insert(0, directory)
+
+    def register_template(self, name, template_path, variant=None):
+        self.registered_templates[(variant, name)] = os.path.abspath(template_path)
+
+    def resolve(self, name, variant=None):
+        lookup_variants = (variant, None) if variant else (None,)
+        for lookup_variant in lookup_variants:
+            if (lookup_variant, name) in self.registered_templates:
+                return self.registered_templates[(lookup_variant, name)]
+            for directory in self.template_directories:
+                candidate_path = os.path.join(directory, lookup_variant, name + TEMPLATE_FILE_SUFFIX) if lookup_variant else os.path.join(directory, name + TEMPLATE_FILE_SUFFIX)
+                if os.path.isfile(candidate_path):
+                    return candidate_path
+        raise TemplateError(f"Template '{name}' not found" + (f" for variant '{variant}'." if variant else "."))
+
+    def resolve_skeleton(self, variant=None):
+        """Pliki niezmienne (kopiowane bez renderowania) z katalogów skeleton/ i wariant/skeleton/; ścieżka względna → plik źródłowy."""
+        skeleton_files = {}
+        lookup_variants = (None, variant) if variant else (None,)
+        for lookup_variant in lookup_variants:
+            # Od najniższego priorytetu - pliki z katalogów o wyższym priorytecie (i wariantowe) nadpisują wcześniejsze
+            for directory in reversed(self.template_directories):
+                skeleton_root = os.path.join(directory, lookup_variant, SKELETON_DIR_NAME) if lookup_variant else os.path.join(directory, SKELETON_DIR_NAME)
+                for walk_root, _, file_names in os.walk(skeleton_root):
+                    for file_name in file_names:
+                        source_path = os.path.join(walk_root, file_name)
+                        skeleton_files[os.path.relpath(source_path, skeleton_root).replace(os.sep, "/")] = source_path
+        return dict(sorted(skeleton_files.items()))
+
+    def render(self, name, variables, variant=None):
+        template_path = self.resolve(name, variant)
+        segments, trailing_literal = compile_template_file(template_path, os.stat(template_path).st_mtime_ns)
+        try:
+            rendered_parts = [part for literal, placeholder in segments for part in (literal, str(variables[placeholder]))]
+        except KeyError as e:
+            raise TemplateError(f"Template '{name}' requires variable {e}.") from None
+        rendered_parts.append(trailing_literal)
+        return "".join(rendered_parts)
+
+TEMPLATE_REGISTRY = TemplateRegistry()
+
+def register_template_directories(template_directories):
+    for directory in template_directories or ():
+        TEMPLATE_REGISTRY.register_directory(directory)
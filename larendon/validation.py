@@ -0,0 +1,81 @@
+import logging
+import os
+
+from larendon.naming import project_identifiers
+from larendon.specs import normalize_manifest_row
+from larendon.versions import resolve_version_target
+
+logger = logging.getLogger(__name__)
+
+# --- Walidacja całej partii specyfikacji przed jakimkolwiek zapisem ---
+# Rodzaje kolizji między projektami: ten sam folder wyjściowy, te same współrzędne Mavena, ten sam pakiet głównej klasy
+COLLISION_KINDS = (("folder", "Folder"), ("coordinates", "Maven coordinates"), ("package", "Java package"))
+MAX_REPORTED_PROBLEMS = 5
+
+class SpecValidationError(ValueError):
+    def __init__(self, problems):
+        self.problems = problems
+        details = "; ".join(f"row {problem['index']}: {problem['error']}" for problem in problems[:MAX_REPORTED_PROBLEMS])
+        if len(problems) > MAX_REPORTED_PROBLEMS:
+            details += f"; ... and {len(problems) - MAX_REPORTED_PROBLEMS} more"
+        super().__init__(f"{len(problems)} invalid plugin spec(s): {details}")
+
+def folder_collision_key(folder):
+    normalized_folder = os.path.normpath(folder)
+    if os.path.isabs(normalized_folder) or normalized_folder == os.pardir or normalized_folder.startswith(os.pardir + os.sep) or normalized_folder == os.curdir:
+        raise ValueError(f"Folder '{folder}' must be a relative path inside the output folder.")
+    # Bez rozróżniania wielkości liter - na Windows i macOS "Alpha" i "alpha" to ten sam folder
+    return normalized_folder.replace(os.sep, "/").casefold()
+
+def plugin_spec_keys(spec, resolved_targets=None):
+    """Sprawdza jedną znormalizowaną specyfikację (folder wewnątrz folderu wyjściowego, znana wersja i serwer) i zwraca jej klucze kolizji."""
+    target_key = (spec.get("minecraft_version"), spec.get("server"))
+    if resolved_targets is None or target_key not in resolved_targets:
+        resolve_version_target(*target_key)
+        if resolved_targets is not None:
+            resolved_targets.add(target_key)
+    identifiers = project_identifiers(spec["author"], spec["artifact_id"])
+    return {
+        "folder": folder_collision_key(spec["folder"]),
+        "coordinates": f"{identifiers['group_id']}:{identifiers['artifact_id']}",
+        "package": identifiers["package_name"],
+    }
+
+def validate_plugin_spec(row):
+    """Jedna specyfikacja spoza manifestu (generate(), generate_project()) przechodzi te same sprawdzenia co wiersz partii."""
+    if not isinstance(row, dict):
+        raise ValueError("Plugin spec must be a mapping.")
+    spec = normalize_manifest_row(row)
+    plugin_spec_keys(spec)
+    return spec
+
+def validate_plugin_specs(rows):
+    """Normalizuje wszystkie wiersze w jednym przejściu i odrzuca partię, jeśli choć jeden jest błędny albo koliduje z innym.
+
+    Kolizje wykrywa słownik "klucz → pierwszy wiersz" dla każdego rodzaju, więc całość jest O(n) zamiast porównywania par.
+    """
+    specs = []
+    problems = []
+    claimed_keys = {kind: {} for kind, _ in COLLISION_KINDS}
+    resolved_targets = set()
+    for index, row in enumerate(rows):
+        folder = row.get("folder", "") if isinstance(row, dict) else ""
+        try:
+            if not isinstance(row, dict):
+                raise ValueError("Plugin spec must be a mapping.")
+            spec = normalize_manifest_row(row)
+            folder = spec["folder"]
+            row_keys = plugin_spec_keys(spec, resolved_targets)
+        except ValueError as e:
+            problems.append({"index": index, "folder": folder, "error": str(e)})
+            continue
+        for kind, label in COLLISION_KINDS:
+            claimed_index = claimed_keys[kind].setdefault(row_keys[kind], index)
+            if claimed_index != index:
+                problems.append({"index": index, "folder": folder, "error": f"{label} '{row_keys[kind]}' is already used by row {claimed_index}."})
+                break
+        specs.append(spec)
+    if problems:
+        logger.error(f"Rejected {len(problems)} of {len(rows)} plugin spec(s) before generation.")
+        raise SpecValidationError(problems)
+    return specs
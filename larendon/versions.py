@@ -0,0 +1,142 @@
+import functools
+import json
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# --- Indeks wersji: wersja Minecrafta/serwera → współrzędne API, poziom Javy i wersje pluginów Mavena ---
+BUILTIN_VERSION_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "versions.json")
+USER_VERSION_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".larendon", "versions.json")
+VERSION_INDEX_ENV_VAR = "LARENDON_VERSION_INDEX"
+MINECRAFT_VERSION_PATTERN = re.compile(r"^(\d+)\.(\d+)(?:\.(\d+))?$")
+SNAPSHOT_VERSION_SUFFIX_PATTERN = re.compile(r"-R\d+(?:\.\d+)*-SNAPSHOT$")
+RELEASE_VERSION_PATTERN = re.compile(r"^\d+(?:\.\d+)*$")
+BUILD_PLUGIN_GROUP_ID = "org.apache.maven.plugins"
+
+class VersionIndexError(ValueError):
+    pass
+
+def parse_version_key(version):
+    return tuple(int(part) for part in version.split("."))
+
+class VersionIndex:
+    """Indeks wczytany z pliku JSON; wszystkie cele (serwer, wersja) są rozwijane raz do słownika - wyszukiwanie to jedno odwołanie."""
+
+    def __init__(self, data, source_path=None):
+        self.data = data
+        self.source_path = source_path
+        self.default_server = data["default_server"]
+        self.default_minecraft_version = data["default_minecraft_version"]
+        self.targets = {}
+        for minecraft_version, entry in data["minecraft_versions"].items():
+            build_plugins = dict(data.get("build_plugins", {}), **entry.get("build_plugins", {}))
+            for server_name, server in data["servers"].items():
+                api_version = entry.get("servers", {}).get(server_name) or server["version_format"].format(minecraft_version=minecraft_version)
+                self.targets[(server_name, minecraft_version)] = {
+                    "server": server_name,
+                    "minecraft_version": minecraft_version,
+                    "server_api_group_id": server["group_id"],
+                    "server_api_artifact_id": server["artifact_id"],
+                    "server_api_version": api_version,
+                    "repository_id": server["repository_id"],
+                    "repository_url": server["repository_url"],
+                    "java_version": entry["java_version"],
+                    "api_version": entry["api_version"],
+                    "compiler_plugin_version": build_plugins["maven-compiler-plugin"],
+                    "shade_plugin_version": build_plugins["maven-shade-plugin"],
+                }
+
+    def servers(self):
+        return sorted(self.data["servers"])
+
+    def minecraft_versions(self):
+        return sorted(self.data["minecraft_versions"], key=parse_version_key)
+
+    def resolve(self, minecraft_version=None, server=None):
+        server = server or self.default_server
+        minecraft_version = minecraft_version or self.default_minecraft_version
+        if server not in self.data["servers"]:
+            raise VersionIndexError(f"Unknown server '{server}'. Known servers: {', '.join(self.servers())}.")
+        target = self.targets.get((server, minecraft_version))
+        if target is None:
+            raise VersionIndexError(f"Minecraft version '{minecraft_version}' is not in the version index. Known versions: {', '.join(self.minecraft_versions())}.")
+        return target
+
+@functools.lru_cache(maxsize=8)
+def load_version_index_file(index_path, index_mtime_ns):
+    # Jak przy szablonach: mtime w kluczu cache - indeks jest parsowany raz, dopóki plik się nie zmieni
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            version_index = VersionIndex(json.load(f), index_path)
+    except (KeyError, TypeError, AttributeError, json.JSONDecodeError) as e:
+        raise VersionIndexError(f"Version index '{index_path}' is invalid: {e}") from None
+    logger.info(f"Loaded version index '{index_path}' ({len(version_index.targets)} target(s))")
+    return version_index
+
+def default_version_index_path():
+    if os.environ.get(VERSION_INDEX_ENV_VAR):
+        return os.environ[VERSION_INDEX_ENV_VAR]
+    return USER_VERSION_INDEX_PATH if os.path.isfile(USER_VERSION_INDEX_PATH) else BUILTIN_VERSION_INDEX_PATH
+
+def load_version_index(index_path=None):
+    index_path = os.path.abspath(index_path or default_version_index_path())
+    return load_version_index_file(index_path, os.stat(index_path).st_mtime_ns)
+
+def resolve_version_target(minecraft_version=None, server=None):
+    return load_version_index().resolve(minecraft_version, server)
+
+# --- Odświeżanie indeksu z lokalnego repozytorium Mavena (~/.m2), bez dostępu do sieci ---
+def list_local_artifact_versions(repository_path, group_id, artifact_id):
+    artifact_path = os.path.join(repository_path, *group_id.split("."), artifact_id)
+    try:
+        entries = list(os.scandir(artifact_path))
+    except OSError:
+        return []
+    versions = []
+    for entry in entries:
+        # Katalog wersji liczy się tylko wtedy, gdy zawiera pom - same metadane nie wystarczą do zbudowania projektu
+        if entry.is_dir() and os.path.isfile(os.path.join(entry.path, f"{artifact_id}-{entry.name}.pom")):
+            versions.append(entry.name)
+    return versions
+
+def import_version_index_from_maven(repository_path, index_path=None, output_path=None):
+    """Dopisuje do indeksu wersje API serwerów i nowsze wersje pluginów Mavena znalezione w lokalnym repozytorium."""
+    version_index = load_version_index(index_path)
+    data = json.loads(json.dumps(version_index.data))
+    minecraft_versions = data["minecraft_versions"]
+    added_versions = []
+    for server_name, server in data["servers"].items():
+        for api_version in list_local_artifact_versions(repository_path, server["group_id"], server["artifact_id"]):
+            minecraft_version = SNAPSHOT_VERSION_SUFFIX_PATTERN.sub("", api_version)
+            version_match = MINECRAFT_VERSION_PATTERN.match(minecraft_version)
+            if not version_match: continue
+            entry = minecraft_versions.get(minecraft_version)
+            if entry is None:
+                # Poziom Javy przejmujemy od najbliższej starszej znanej wersji (albo najstarszej, jeśli brak starszych)
+                known_versions = sorted(minecraft_versions, key=parse_version_key)
+                older_versions = [v for v in known_versions if parse_version_key(v) < parse_version_key(minecraft_version)]
+                template_entry = minecraft_versions[older_versions[-1] if older_versions else known_versions[0]]
+                entry = minecraft_versions[minecraft_version] = {"java_version": template_entry["java_version"], "api_version": f"{version_match.group(1)}.{version_match.group(2)}"}
+                added_versions.append(minecraft_version)
+            if api_version != server["version_format"].format(minecraft_version=minecraft_version):
+                entry.setdefault("servers", {})[server_name] = api_version
+
+    updated_plugins = {}
+    for plugin_artifact_id, current_version in data["build_plugins"].items():
+        local_versions = [v for v in list_local_artifact_versions(repository_path, BUILD_PLUGIN_GROUP_ID, plugin_artifact_id) if RELEASE_VERSION_PATTERN.match(v)]
+        newest_version = max(local_versions, key=parse_version_key, default=None)
+        if newest_version and parse_version_key(newest_version) > parse_version_key(current_version):
+            data["build_plugins"][plugin_artifact_id] = updated_plugins[plugin_artifact_id] = newest_version
+
+    data["minecraft_versions"] = {v: minecraft_versions[v] for v in sorted(minecraft_versions, key=parse_version_key)}
+    output_path = os.path.abspath(output_path or USER_VERSION_INDEX_PATH)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    temporary_path = output_path + ".tmp"
+    with open(temporary_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+    os.replace(temporary_path, output_path)
+    logger.info(f"Version index written to '{output_path}': {len(added_versions)} new Minecraft version(s), {len(updated_plugins)} updated build plugin(s)")
+    return {"index": output_path, "source": version_index.source_path, "added_minecraft_versions": sorted(added_versions, key=parse_version_key), "updated_build_plugins": updated_plugins}
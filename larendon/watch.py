@@ -0,0 +1,181 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+
+from larendon.generator import plan_project_from_spec, scaffold_project_from_spec
+from larendon.incremental import load_generation_manifest, save_generation_manifest
+from larendon.instrumentation import span
+from larendon.specs import PROJECT_SPEC_FILE_NAME, load_project_spec
+from larendon.writer import ProjectWriter
+
+logger = logging.getLogger(__name__)
+
+# --- Tryb obserwowania: zmiana larendon.json w projekcie → regeneracja tylko plików, których treść się zmieniła ---
+WATCH_POLL_INTERVAL_SEC = 1.0
+WATCH_DEBOUNCE_SEC = 0.3
+# Co tyle sekund foldery nadrzędne są przeszukiwane ponownie w poszukiwaniu nowych projektów
+WATCH_RESCAN_INTERVAL_SEC = 10.0
+
+def spec_file_signature(project_path):
+    # Jedno stat() na projekt i cykl; i-węzeł wykrywa też zapis przez podmianę pliku (edytory zapisujące atomowo)
+    try:
+        spec_stat = os.stat(os.path.join(project_path, PROJECT_SPEC_FILE_NAME))
+    except OSError:
+        return None
+    return (spec_stat.st_mtime_ns, spec_stat.st_size, spec_stat.st_ino)
+
+def discover_projects(watch_paths):
+    """Projekty do obserwowania: podane foldery z larendon.json oraz ich bezpośrednie podfoldery z tym plikiem."""
+    project_paths = set()
+    for watch_path in watch_paths:
+        watch_path = os.path.abspath(watch_path)
+        if os.path.isfile(os.path.join(watch_path, PROJECT_SPEC_FILE_NAME)):
+            project_paths.add(watch_path)
+            continue
+        try:
+            entries = list(os.scandir(watch_path))
+        except OSError as e:
+            logger.warning(f"Cannot scan '{watch_path}' for projects: {e}")
+            continue
+        for entry in entries:
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, PROJECT_SPEC_FILE_NAME)):
+                project_paths.add(entry.path)
+    return project_paths
+
+def prune_empty_directories(project_path, directory_path):
+    while os.path.normcase(directory_path) != os.path.normcase(project_path) and directory_path.startswith(project_path + os.sep):
+        try:
+            os.rmdir(directory_path)
+        except OSError:
+            return  # Folder nie jest pusty (albo zniknął) - wyżej na pewno też nie jest pusty
+        directory_path = os.path.dirname(directory_path)
+
+def is_template_output_path(relative_path, template_directories):
+    return any(relative_path.startswith(relative_dir.rstrip("/") + "/") for relative_dir in template_directories)
+
+def remove_stale_outputs(project_path, planned_paths, template_directories, fsync_policy="none"):
+    """Usuwa pliki wygenerowane wcześniej, których nowa specyfikacja już nie tworzy (np. główna klasa po zmianie pakietu).
+
+    Dotyczy tylko plików w folderach planu szablonów (template_directories) - wpisy manifestu innych zapisów,
+    np. .mvn/maven.config z rozgrzewania cache Mavena, zostają. Plik zmieniony przez użytkownika zostaje na miejscu,
+    znika tylko z manifestu generacji.
+    """
+    generation_manifest = load_generation_manifest(project_path)
+    removed_paths = []
+    stale_paths = [relative_path for relative_path in generation_manifest if relative_path not in planned_paths and is_template_output_path(relative_path, template_directories)]
+    for relative_path in stale_paths:
+        file_path = os.path.join(project_path, *relative_path.split("/"))
+        try:
+            with open(file_path, "rb") as f:
+                unchanged = hashlib.sha256(f.read()).hexdigest() == generation_manifest[relative_path]
+            if unchanged:
+                os.remove(file_path)
+                removed_paths.append(relative_path)
+                prune_empty_directories(project_path, os.path.dirname(file_path))
+            else:
+                logger.warning(f"File '{file_path}' is no longer generated but was modified since. Left untouched.")
+        except FileNotFoundError:
+            pass
+        del generation_manifest[relative_path]
+    if stale_paths:
+        with ProjectWriter(project_path, fsync_policy) as project_writer:
+            save_generation_manifest(project_path, generation_manifest, project_writer)
+    return removed_paths
+
+def regenerate_project(project_path, default_variant=None, fsync_policy="none"):
+    started_at = time.perf_counter()
+    spec = load_project_spec(project_path)
+    with span("watch_regenerate", project=project_path):
+        # Projekt istnieje, więc działa ścieżka przyrostowa: zapisywane są tylko pliki o zmienionej treści;
+        # larendon.json jest źródłem tej regeneracji - zostaje w postaci od użytkownika i staje się nowym punktem odniesienia
+        generation_report = scaffold_project_from_spec(spec, os.path.dirname(project_path), default_variant, fsync_policy=fsync_policy, task_workers=1, adopt_spec_file=True)
+        planned_paths = {relative_path for relative_paths in generation_report.values() for relative_path in relative_paths}
+        # Ścieżki zależne od specyfikacji (pakiet, nazwa klasy) leżą tylko w folderach źródeł planu
+        template_directories = plan_project_from_spec(spec, os.path.dirname(project_path), default_variant)["invariant_directories"]
+        removed_paths = remove_stale_outputs(project_path, planned_paths, template_directories, fsync_policy)
+    return {
+        "project": project_path,
+        "created": generation_report["created"],
+        "updated": generation_report["updated"],
+        "removed": removed_paths,
+        "modified": generation_report["modified"],
+        "elapsed_ms": round((time.perf_counter() - started_at) * 1000, 3),
+    }
+
+class ProjectWatcher:
+    """Obserwuje wiele projektów w jednym wątku przez odpytywanie stat() (bez inotify - tylko biblioteka standardowa).
+
+    Seria zapisów jednego pliku jest łączona: regeneracja startuje dopiero po debounce_sec ciszy. Bez zmian wątek
+    śpi cały poll_interval_sec, więc koszt bezczynności to jedno stat() na projekt na cykl.
+    """
+
+    def __init__(self, watch_paths, poll_interval_sec=WATCH_POLL_INTERVAL_SEC, debounce_sec=WATCH_DEBOUNCE_SEC, default_variant=None, fsync_policy="none", on_event=None, rescan_interval_sec=WATCH_RESCAN_INTERVAL_SEC):
+        self.watch_paths = list(watch_paths)
+        self.poll_interval_sec = max(0.01, poll_interval_sec)
+        self.debounce_sec = max(0.0, debounce_sec)
+        self.rescan_interval_sec = rescan_interval_sec
+        self.default_variant = default_variant
+        self.fsync_policy = fsync_policy
+        self.on_event = on_event
+        self.signatures = {}
+        self.pending_deadlines = {}
+        self.next_rescan_at = 0.0
+        self.stop_event = threading.Event()
+
+    def rescan(self, now):
+        project_paths = discover_projects(self.watch_paths)
+        for project_path in project_paths - set(self.signatures):
+            # Stan początkowy jest punktem odniesienia - regenerujemy dopiero po zmianie
+            self.signatures[project_path] = spec_file_signature(project_path)
+            logger.info(f"Watching project '{project_path}'")
+        for project_path in set(self.signatures) - project_paths:
+            del self.signatures[project_path]
+            self.pending_deadlines.pop(project_path, None)
+            logger.info(f"Project '{project_path}' is gone; no longer watched.")
+        self.next_rescan_at = now + self.rescan_interval_sec
+
+    def poll(self, now):
+        for project_path, previous_signature in self.signatures.items():
+            signature = spec_file_signature(project_path)
+            if signature != previous_signature:
+                self.signatures[project_path] = signature
+                if signature is not None:
+                    # Każda kolejna zmiana przesuwa termin - regeneracja startuje dopiero po chwili ciszy
+                    self.pending_deadlines[project_path] = now + self.debounce_sec
+        ready_paths = sorted(project_path for project_path, deadline in self.pending_deadlines.items() if deadline <= now)
+        for project_path in ready_paths:
+            del self.pending_deadlines[project_path]
+            self.regenerate(project_path)
+        return len(ready_paths)
+
+    def regenerate(self, project_path):
+        try:
+            event = regenerate_project(project_path, self.default_variant, self.fsync_policy)
+            logger.info(f"Regenerated '{project_path}': {len(event['created'])} created, {len(event['updated'])} updated, {len(event['removed'])} removed.")
+        except (OSError, ValueError) as e:
+            logger.error(f"Regeneration of '{project_path}' failed: {e}")
+            event = {"project": project_path, "error": str(e)}
+        if self.on_event is not None:
+            self.on_event(event)
+        return event
+
+    def run(self, max_cycles=None):
+        cycles = 0
+        while not self.stop_event.is_set():
+            now = time.monotonic()
+            if now >= self.next_rescan_at:
+                self.rescan(now)
+            self.poll(now)
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+            # Do najbliższego terminu debounce, ale nie dłużej niż interwał odpytywania
+            wait_sec = self.poll_interval_sec
+            if self.pending_deadlines:
+                wait_sec = min(wait_sec, max(0.0, min(self.pending_deadlines.values()) - time.monotonic()))
+            self.stop_event.wait(wait_sec)
+
+    def stop(self):
+        self.stop_event.set()
@@ -0,0 +1,367 @@
+import contextlib
+import logging
+import os
+import secrets
+import stat
+import threading
+
+logger = logging.getLogger(__name__)
+
+# --- Atomowy zapis plików projektu: przygotowanie w katalogu tymczasowym i publikacja jedną zmianą nazwy ---
+FSYNC_POLICIES = ("none", "project", "file")
+STAGING_DIR_PREFIX = ".larendon-stage-"
+# Tyle losowych nazw próbujemy, zanim uznamy, że folder nadrzędny jest zapchany (tyle samo co tempfile.TMP_MAX)
+STAGING_NAME_ATTEMPTS = 10000
+
+def create_staging_directory(parent_path):
+    """Zwraca ścieżkę nowego katalogu tymczasowego i liczbę wykonanych wywołań systemowych."""
+    # os.mkdir zamiast tempfile.mkdtemp: prawa folderu wynikają z umask procesu (mkdtemp zawsze daje 0700),
+    # a po zmianie nazwy ten folder staje się folderem projektu
+    for attempt in range(1, STAGING_NAME_ATTEMPTS + 1):
+        staging_path = os.path.join(parent_path, STAGING_DIR_PREFIX + secrets.token_hex(6))
+        try:
+            os.mkdir(staging_path)
+        except FileExistsError:
+            continue
+        return staging_path, attempt
+    raise FileExistsError(f"No free staging folder name found in '{parent_path}'.")
+
+def make_directories(directory_path):
+    """Jak os.makedirs(exist_ok=True), ale zwraca liczbę wykonanych wywołań systemowych (stat i mkdir)."""
+    if os.path.isdir(directory_path):
+        return 1
+    syscalls = 1
+    parent_path = os.path.dirname(directory_path)
+    if parent_path and parent_path != directory_path:
+        syscalls += make_directories(parent_path)
+    try:
+        os.mkdir(directory_path)
+    except FileExistsError:
+        # Inny wątek utworzył ten folder w międzyczasie
+        syscalls += 1
+        if not os.path.isdir(directory_path):
+            raise
+    return syscalls + 1
+
+def remove_directory_tree(directory_path):
+    """Jak shutil.rmtree(ignore_errors=True), ale zwraca liczbę wykonanych wywołań systemowych."""
+    syscalls = 1
+    try:
+        with os.scandir(directory_path) as entries:
+            entries = list(entries)
+    except OSError:
+        return syscalls
+    for entry in entries:
+        # Typ wpisu pochodzi z samego odczytu katalogu (d_type) - bez dodatkowego stat
+        if entry.is_dir(follow_symlinks=False):
+            syscalls += remove_directory_tree(entry.path)
+            continue
+        try:
+            os.unlink(entry.path)
+        except OSError:
+            pass
+        syscalls += 1
+    try:
+        os.rmdir(directory_path)
+    except OSError:
+        pass
+    return syscalls + 1
+
+def encode_generated_content(content):
+    # Zachowujemy zachowanie zapisu w trybie tekstowym (końce linii zgodne z systemem)
+    return content.replace("\n", os.linesep).encode("utf-8")
+
+def new_io_stats():
+    # syscalls: każde wywołanie modułu os (także os.path.isdir/exists) wykonane przez writer liczy się jako jedno wywołanie systemowe
+    return {"files_written": 0, "bytes_written": 0, "files_cloned": 0, "bytes_cloned": 0, "syscalls": 0, "fsyncs": 0}
+
+# --- Klonowanie pliku bez przepisywania danych przez proces: hardlink (tylko na życzenie), reflink, copy_file_range, kopia ---
+FICLONE_IOCTL = 0x40049409
+CLONE_COPY_CHUNK_SIZE = 1 << 20
+# Urządzenia (st_dev), na których reflink już raz się nie udał - kolejne pliki nie próbują go ponownie
+REFLINK_UNSUPPORTED_DEVICES = set()
+
+def clone_file(source_path, target_path, use_hardlink=False, fsync=False, source_size=None, target_device=None):
+    """Zwraca użytą metodę ("hardlink", "reflink", "copy_file_range" albo "copy") i liczbę wykonanych wywołań systemowych."""
+    link_syscalls = 0
+    if use_hardlink:
+        # Wspólny i-węzeł: edycja pliku w projekcie zmieniłaby też źródło - dlatego tylko na wyraźne życzenie
+        try:
+            os.link(source_path, target_path)
+            return "hardlink", 1
+        except OSError:
+            link_syscalls = 1  # Np. inny system plików - klonujemy zwykłą drogą
+    source_fd = os.open(source_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        target_fd = os.open(target_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            syscalls = 4 + link_syscalls
+            method = None
+            if target_device not in REFLINK_UNSUPPORTED_DEVICES:
+                try:
+                    import fcntl
+                    fcntl.ioctl(target_fd, FICLONE_IOCTL, source_fd)
+                    method = "reflink"
+                except (ImportError, OSError):
+                    # System plików bez współdzielenia bloków (np. ext4, tmpfs) albo inny system operacyjny
+                    if target_device is not None: REFLINK_UNSUPPORTED_DEVICES.add(target_device)
+                syscalls += 1
+            if method is None and hasattr(os, "copy_file_range"):
+                try:
+                    # Przy znanym rozmiarze zwykle wystarcza jedno wywołanie; 0 oznacza koniec pliku
+                    remaining_size = source_size
+                    while remaining_size is None or remaining_size > 0:
+                        copied_size = os.copy_file_range(source_fd, target_fd, remaining_size or CLONE_COPY_CHUNK_SIZE)
+                        syscalls += 1
+                        if not copied_size: break
+                        if remaining_size is not None: remaining_size -= copied_size
+                    method = "copy_file_range"
+                except OSError:
+                    os.lseek(source_fd, 0, os.SEEK_SET)
+                    os.lseek(target_fd, 0, os.SEEK_SET)
+                    os.ftruncate(target_fd, 0)
+                    syscalls += 3
+            if method is None:
+                while True:
+                    chunk = os.read(source_fd, CLONE_COPY_CHUNK_SIZE)
+                    syscalls += 1
+                    if not chunk: break
+                    view = memoryview(chunk)
+                    while view:
+                        view = view[os.write(target_fd, view):]
+                        syscalls += 1
+                method = "copy"
+            if fsync:
+                os.fsync(target_fd)
+                syscalls += 1
+        finally:
+            os.close(target_fd)
+    finally:
+        os.close(source_fd)
+    return method, syscalls
+
+def merge_io_stats(total_stats, stats):
+    for key, value in stats.items():
+        total_stats[key] = total_stats.get(key, 0) + value
+    return total_stats
+
+class ProjectWriter:
+    """Zbiera wszystkie pliki projektu w katalogu tymczasowym obok projektu i publikuje je dopiero w commit().
+
+    Nowy (lub pusty) folder projektu jest publikowany jedną atomową zmianą nazwy całego drzewa; w istniejącym
+    folderze każdy plik jest podmieniany atomowo przez os.replace, więc przerwanie nigdy nie zostawia połowy pom.xml.
+    """
+
+    def __init__(self, base_path, fsync_policy="none", backend=None):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy '{fsync_policy}'. Use one of: {', '.join(FSYNC_POLICIES)}.")
+        if backend is None:
+            from larendon.backends import DISK_BACKEND
+            backend = DISK_BACKEND
+        # Backend, z którego czytamy opublikowany stan projektu (manifest, pliki do porównania)
+        self.backend = backend
+        self.base_path = os.path.abspath(base_path)
+        self.fsync_policy = fsync_policy
+        self.stats = new_io_stats()
+        self.staged_files = []
+        self.staged_directories = []
+        self.staging_path = None
+        self.closed = False
+        self.lock = threading.Lock()
+        # Zapisy w toku poza blokadą - abort() czeka na ich koniec, zanim usunie katalog tymczasowy
+        self.pending_writes = 0
+        self.writes_done = threading.Condition(self.lock)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+    def _check_open(self):
+        if self.closed:
+            raise RuntimeError(f"Project writer for {self.base_path} is already closed.")
+
+    def _ensure_staging_path(self):
+        self._check_open()
+        if self.staging_path is None:
+            parent_path = os.path.dirname(self.base_path)
+            self.stats["syscalls"] += make_directories(parent_path)
+            # Ten sam katalog nadrzędny = ten sam system plików, więc os.rename/os.replace są atomowe
+            self.staging_path, syscalls = create_staging_directory(parent_path)
+            self.stats["syscalls"] += syscalls
+        return self.staging_path
+
+    def _fsync_directory(self, directory_path):
+        if os.name == "nt":
+            return
+        directory_fd = os.open(directory_path, os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+        self.stats["syscalls"] += 3
+        self.stats["fsyncs"] += 1
+
+    @contextlib.contextmanager
+    def _pending_write(self):
+        # Blokada chroni tylko wspólny stan writera - zapis i fsync idą równolegle z innymi wątkami
+        with self.lock:
+            staging_path = self._ensure_staging_path()
+            self.pending_writes += 1
+        try:
+            yield staging_path
+        finally:
+            with self.lock:
+                self.pending_writes -= 1
+                self.writes_done.notify_all()
+
+    def ensure_directory(self, relative_dir):
+        relative_dir = relative_dir.replace(os.sep, "/")
+        if os.path.isdir(os.path.join(self.base_path, *relative_dir.split("/"))):
+            with self.lock:
+                self.stats["syscalls"] += 1
+            return
+        with self._pending_write() as staging_path:
+            syscalls = 1 + make_directories(os.path.join(staging_path, *relative_dir.split("/")))
+        with self.lock:
+            self._check_open()
+            self.stats["syscalls"] += syscalls
+            self.staged_directories.append(relative_dir)
+
+    def stage_file(self, relative_path, content):
+        relative_path = relative_path.replace(os.sep, "/")
+        data = encode_generated_content(content)
+        syscalls = 2  # open i close
+        fsyncs = 0
+        with self._pending_write() as staging_path:
+            staged_file_path = os.path.join(staging_path, *relative_path.split("/"))
+            syscalls += make_directories(os.path.dirname(staged_file_path))
+            fd = os.open(staged_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+            try:
+                view = memoryview(data)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+                    syscalls += 1
+                if self.fsync_policy == "file":
+                    os.fsync(fd)
+                    syscalls += 1
+                    fsyncs += 1
+            finally:
+                os.close(fd)
+        with self.lock:
+            # abort() w trakcie zapisu usunął plik razem z katalogiem tymczasowym - wywołujący musi się o tym dowiedzieć
+            self._check_open()
+            self.stats["syscalls"] += syscalls
+            self.stats["fsyncs"] += fsyncs
+            self.stats["files_written"] += 1
+            self.stats["bytes_written"] += len(data)
+            if relative_path not in self.staged_files:
+                self.staged_files.append(relative_path)
+
+    def clone_tree(self, source_root, relative_files, relative_dirs=(), use_hardlink=False, file_sizes=None):
+        """Klonuje gotowe drzewo (np. szkielet projektu) do katalogu tymczasowego - tylko dla nowego lub pustego folderu projektu."""
+        with self.lock:
+            staging_path = self._ensure_staging_path()
+            for relative_dir in relative_dirs:
+                self.stats["syscalls"] += make_directories(os.path.join(staging_path, *relative_dir.split("/")))
+                self.staged_directories.append(relative_dir)
+            clone_methods = {}
+            staging_device = os.stat(staging_path).st_dev
+            self.stats["syscalls"] += 1
+            for relative_path in relative_files:
+                source_path = os.path.join(source_root, *relative_path.split("/"))
+                staged_file_path = os.path.join(staging_path, *relative_path.split("/"))
+                self.stats["syscalls"] += make_directories(os.path.dirname(staged_file_path))
+                source_size = file_sizes.get(relative_path) if file_sizes else None
+                method, syscalls = clone_file(source_path, staged_file_path, use_hardlink, self.fsync_policy == "file", source_size, staging_device)
+                clone_methods[method] = clone_methods.get(method, 0) + 1
+                self.stats["syscalls"] += syscalls
+                if self.fsync_policy == "file" and method != "hardlink":
+                    self.stats["fsyncs"] += 1
+                if source_size is None:
+                    source_size = os.path.getsize(staged_file_path)
+                    self.stats["syscalls"] += 1
+                self.stats["files_cloned"] += 1
+                self.stats["bytes_cloned"] += source_size
+                if relative_path not in self.staged_files:
+                    self.staged_files.append(relative_path)
+            return clone_methods
+
+    def commit(self):
+        with self.lock:
+            # Writer zamknięty przez abort() (np. z anulowanego zadania asyncio) niczego już nie publikuje
+            self._check_open()
+            if self.staging_path is None:
+                return
+            # Trwająca publikacja liczy się jak zapis w toku - abort() z innego wątku poczeka na jej koniec
+            self.pending_writes += 1
+        staging_path = self.staging_path
+        try:
+            if self.fsync_policy == "project":
+                for relative_path in self.staged_files:
+                    fd = os.open(os.path.join(staging_path, *relative_path.split("/")), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                    self.stats["syscalls"] += 3
+                    self.stats["fsyncs"] += 1
+
+            base_is_directory = os.path.isdir(self.base_path)
+            self.stats["syscalls"] += 1
+            if base_is_directory:
+                base_is_empty = not os.listdir(self.base_path)
+                self.stats["syscalls"] += 1
+            if base_is_directory and base_is_empty:
+                # Pusty folder (np. utworzony przed chwilą w trybie interaktywnym) zastępujemy, zachowując jego prawa
+                os.chmod(staging_path, stat.S_IMODE(os.stat(self.base_path).st_mode))
+                os.rmdir(self.base_path)
+                self.stats["syscalls"] += 3
+            base_exists = os.path.exists(self.base_path)
+            self.stats["syscalls"] += 1
+            if not base_exists:
+                os.rename(staging_path, self.base_path)
+                self.stats["syscalls"] += 1
+                self.staging_path = None
+                if self.fsync_policy != "none":
+                    self._fsync_directory(os.path.dirname(self.base_path))
+            else:
+                touched_directories = set()
+                for relative_dir in self.staged_directories:
+                    self.stats["syscalls"] += make_directories(os.path.join(self.base_path, *relative_dir.split("/")))
+                for relative_path in self.staged_files:
+                    target_path = os.path.join(self.base_path, *relative_path.split("/"))
+                    self.stats["syscalls"] += make_directories(os.path.dirname(target_path))
+                    os.replace(os.path.join(staging_path, *relative_path.split("/")), target_path)
+                    self.stats["syscalls"] += 1
+                    touched_directories.add(os.path.dirname(target_path))
+                if self.fsync_policy != "none":
+                    for directory_path in sorted(touched_directories):
+                        self._fsync_directory(directory_path)
+            for relative_path in self.staged_files:
+                logger.info(f"Successfully written to file: {os.path.join(self.base_path, *relative_path.split('/'))}")
+        except OSError as e:
+            logger.error(f"Failed to publish files into {self.base_path}: {e}")
+            raise
+        finally:
+            with self.lock:
+                self.pending_writes -= 1
+                self.writes_done.notify_all()
+            self.abort()
+
+    def abort(self):
+        with self.lock:
+            self.closed = True
+            # Zapis w toku odtworzyłby usunięty katalog tymczasowy (os.makedirs) i zostawił go osieroconego obok projektu
+            self.writes_done.wait_for(lambda: not self.pending_writes)
+            if self.staging_path is not None:
+                self.stats["syscalls"] += remove_directory_tree(self.staging_path)
+                self.staging_path = None
+            self.staged_files = []
+            self.staged_directories = []